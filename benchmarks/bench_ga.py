@@ -0,0 +1,208 @@
+"""Benchmark reprodutível dos pontos quentes do algoritmo genético.
+
+Uso:
+    python -m benchmarks.bench_ga --sizes 10 100 500 2000 --out bench.json
+    python -m benchmarks.bench_ga --sizes 10 100 --compare bench.json
+    python -m benchmarks.bench_ga --sizes 500 2000 5000 --distance-neighbors 8 --crossover-method geometric
+"""
+import argparse
+import json
+import platform
+import random
+import subprocess
+import time
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.synthetic import make_config
+from core.config import build_genetic
+from core.fitness import NeighborFitnessEvaluator
+from core.operators import crossover_population
+
+# Métodos comparados pela contagem de colisões nos filhos do crossover
+COLLISION_METHODS = ("one_point", "geometric")
+
+
+def time_calls(func, repeat, *args):
+    """Executa func `repeat` vezes e retorna as estatísticas de tempo por chamada"""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        durations.append(time.perf_counter() - start)
+    return {'calls': repeat, 'mean_s': sum(durations) / repeat, 'min_s': min(durations)}
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def crossover_collisions(genetic, methods=COLLISION_METHODS, trials=3, seed=0):
+    """Média de colisões entre mesas nos filhos de cada método de crossover, com os mesmos pais.
+
+    Usa o avaliador de vizinhas, cuja contagem de colisões é exata e não monta todos os pares.
+    """
+    evaluator = NeighborFitnessEvaluator(genetic.planta, genetic.restricted_areas, genetic.spacing)
+    bounds = (genetic.planta['largura'], genetic.planta['altura'])
+    population = genetic.population
+    results = {}
+    for method in methods:
+        counts = []
+        for trial in range(trials):
+            rng = np.random.default_rng(seed + trial)
+            parents = rng.permutation(len(population))
+            children = np.empty_like(population)
+            crossover_population(rng, method, population, parents, children, bounds=bounds,
+                                 resolve=genetic.resolve_conflicts)
+            packed = genetic.genome.pack(children)
+            x, y, w, h = (packed[..., k] for k in range(4))
+            in_bounds = (0 <= x) & (x <= evaluator.largura - w) & (0 <= y) & (y <= evaluator.altura - h)
+            counts.append(evaluator._collisions(x, y, w, h, in_bounds, None, None).mean())
+        results[method] = float(np.mean(counts))
+    return results
+
+
+def bench_size(n_tables, seed=0, population_size=40, generations=20, repeat=5,
+               distance_neighbors=None, crossover_method=None):
+    """Mede as funções principais para uma planta sintética com n_tables mesas"""
+    config = make_config(n_tables, seed=seed)
+    genetic = build_genetic(config, population_size=population_size, seed=seed, cache_size=0,
+                            distance_neighbors=distance_neighbors, crossover_method=crossover_method)
+    layout = genetic.layout
+    planta = config['planta']
+    rng = random.Random(seed)
+
+    # Reduz as repetições das funções O(n²) em Python puro nas plantas grandes
+    slow_repeat = max(1, repeat if n_tables <= 100 else 1)
+    individual = genetic.population[0]
+    parent1, parent2 = genetic.population[0], genetic.population[1]
+    index = layout.new_table_index()
+    for i, (x, y, w, h) in enumerate(genetic.genome.rects(individual).tolist()):
+        index.insert(i, x, y, w, h)
+    candidates = [
+        (rng.randint(0, planta['largura'] - 10), rng.randint(0, planta['altura'] - 3), 10, 3)
+        for _ in range(1000)
+    ]
+
+    fitness_scores = genetic.evaluate_population(genetic.population)
+    parents = genetic.selection_indices(fitness_scores, population_size)
+    children = np.empty_like(genetic.population)
+
+    def check_candidates():
+        for x, y, w, h in candidates:
+            layout.is_valid_rect(x, y, w, h, index)
+
+    timings = {
+        'create_individual': time_calls(genetic.create_individual, slow_repeat),
+        'evaluate_population': time_calls(genetic.evaluate_population, repeat, genetic.population),
+        'mutate': time_calls(lambda: genetic.mutate(individual.copy()), repeat),
+        'crossover': time_calls(genetic.crossover, repeat, parent1, parent2),
+        'selection_indices': time_calls(genetic.selection_indices, repeat, fitness_scores, population_size),
+        'crossover_population': time_calls(crossover_population, repeat, genetic.np_rng, genetic.crossover_method,
+                                           genetic.population, parents, children,
+                                           (planta['largura'], planta['altura']), genetic.resolve_conflicts),
+        'is_valid_rect_x1000': time_calls(check_candidates, repeat),
+    }
+    child_collisions = crossover_collisions(genetic, seed=seed)
+
+    # A referência em Python puro percorre todos os pares; no modo de vizinhas ela mediria outra coisa
+    if not distance_neighbors:
+        timings['fitness'] = time_calls(genetic.fitness, slow_repeat, individual)
+
+    start = time.perf_counter()
+    for _ in range(generations):
+        genetic.next_generation()
+    elapsed = time.perf_counter() - start
+    timings['next_generation'] = {'calls': generations, 'mean_s': elapsed / generations, 'min_s': None}
+
+    # Pico de memória medido em uma passada separada, pois o tracemalloc distorce os tempos
+    tracemalloc.start()
+    genetic.next_generation()
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    genetic.close()
+
+    return {
+        'tables': n_tables,
+        'plant': [planta['largura'], planta['altura']],
+        'population_size': population_size,
+        'distance_neighbors': distance_neighbors,
+        'crossover_method': genetic.crossover_method,
+        'timings': timings,
+        'crossover_collisions': child_collisions,
+        'generations_per_second': generations / elapsed,
+        'peak_memory_bytes': peak_memory
+    }
+
+
+def compare(results, baseline_file):
+    """Imprime a razão entre os tempos atuais e os de um JSON anterior (>1 = mais lento)"""
+    with open(baseline_file) as f:
+        baseline = {entry['tables']: entry for entry in json.load(f)['results']}
+    for entry in results:
+        old = baseline.get(entry['tables'])
+        if old is None:
+            continue
+        for name, timing in entry['timings'].items():
+            if name in old['timings'] and old['timings'][name]['mean_s']:
+                ratio = timing['mean_s'] / old['timings'][name]['mean_s']
+                print(f"{entry['tables']:>6} mesas  {name:<26} {ratio:6.2f}x")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmark dos pontos quentes do algoritmo genético")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 500, 2000])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--population-size', type=int, default=40)
+    parser.add_argument('--generations', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--distance-neighbors', type=int, help="Usa o avaliador de vizinhas com N vizinhas por mesa")
+    parser.add_argument('--crossover-method', choices=['one_point', 'two_point', 'uniform', 'geometric'])
+    parser.add_argument('--out', help="Arquivo JSON de saída")
+    parser.add_argument('--compare', help="JSON de uma execução anterior para comparar")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    results = []
+    for n_tables in args.sizes:
+        entry = bench_size(n_tables, seed=args.seed, population_size=args.population_size,
+                           generations=args.generations, repeat=args.repeat,
+                           distance_neighbors=args.distance_neighbors, crossover_method=args.crossover_method)
+        results.append(entry)
+        print(f"{n_tables:>6} mesas  {entry['generations_per_second']:8.2f} gerações/s  "
+              f"pico {entry['peak_memory_bytes'] / 1e6:8.1f} MB")
+        for name, timing in entry['timings'].items():
+            print(f"        {name:<26} {timing['mean_s'] * 1e3:10.3f} ms")
+        for method, count in entry['crossover_collisions'].items():
+            print(f"        colisões nos filhos ({method}) {count:10.1f}")
+
+    report = {
+        'meta': {
+            'revision': git_revision(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'seed': args.seed,
+            'distance_neighbors': args.distance_neighbors,
+            'crossover_method': args.crossover_method
+        },
+        'results': results
+    }
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        compare(results, args.compare)
+    return report
+
+
+if __name__ == "__main__":
+    main()
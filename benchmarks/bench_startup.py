@@ -0,0 +1,126 @@
+"""Benchmark do tempo de inicialização: importação dos módulos e tempo até a primeira geração.
+
+Cada cenário roda em um processo Python novo, como um job pequeno de uma varredura ou
+um worker de um pool.
+
+Uso:
+    python -m benchmarks.bench_startup --repeat 10 --out startup.json
+    python -m benchmarks.bench_startup --compare startup.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from benchmarks.bench_ga import git_revision
+
+# Cenários medidos, cada um executado com `python -c` na raiz do repositório
+SCENARIOS = {
+    'import_core_genetics': "import core.genetics",
+    'import_core_run': "import core.run",
+    'first_generation': (
+        "from core.config import build_genetic, load_config\n"
+        "genetic = build_genetic(load_config('config/config.json'), seed=0)\n"
+        "genetic.next_generation()"
+    ),
+    'import_ui_visualizer': "import ui.visualizer",
+}
+
+# Módulos pesados que o otimizador não deveria carregar sem necessidade
+HEAVY_MODULES = ('matplotlib', 'pygame', 'concurrent.futures.process', 'multiprocessing.pool', 'pandas')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code, *flags):
+    return subprocess.run([sys.executable, *flags, '-c', code], cwd=ROOT, capture_output=True, text=True)
+
+
+def heaviest_imports(code, top=10):
+    """Módulos com maior tempo acumulado de importação (python -X importtime)"""
+    result = _run(code, '-X', 'importtime')
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        imports.append((int(cumulative), name.strip()))
+    imports.sort(reverse=True)
+    return [{'module': name, 'cumulative_ms': us / 1e3} for us, name in imports[:top]]
+
+
+def bench_scenario(code, repeat=10):
+    """Tempo de parede de `repeat` processos novos executando o cenário"""
+    probe = f"{code}\nimport sys\nprint(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    result = _run(probe)
+    if result.returncode != 0:
+        return {'error': result.stderr.strip().splitlines()[-1]}
+    # A última linha da saída é a da sonda (alguns módulos imprimem uma saudação ao serem importados)
+    lines = result.stdout.strip().splitlines()
+    loaded = lines[-1] if lines else ''
+
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _run(code)
+        durations.append(time.perf_counter() - start)
+    return {
+        'calls': repeat,
+        'mean_s': sum(durations) / repeat,
+        'min_s': min(durations),
+        'heavy_modules': [name for name in loaded.split(',') if name],
+        'heaviest_imports': heaviest_imports(code)
+    }
+
+
+def compare(results, baseline_file):
+    """Imprime a razão entre os tempos atuais e os de um JSON anterior (>1 = mais lento)"""
+    with open(baseline_file) as f:
+        baseline = json.load(f)['results']
+    for name, timing in results.items():
+        old = baseline.get(name, {})
+        if 'min_s' in timing and old.get('min_s'):
+            print(f"{name:<24} {timing['min_s'] / old['min_s']:6.2f}x")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmark do tempo de inicialização do otimizador")
+    parser.add_argument('--scenarios', nargs='+', choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--out', help="Arquivo JSON de saída")
+    parser.add_argument('--compare', help="JSON de uma execução anterior para comparar")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    results = {}
+    for name in args.scenarios:
+        entry = results[name] = bench_scenario(SCENARIOS[name], repeat=args.repeat)
+        if 'error' in entry:
+            print(f"{name:<24} indisponível: {entry['error']}")
+            continue
+        heavy = ", ".join(entry['heavy_modules']) or "-"
+        print(f"{name:<24} {entry['min_s'] * 1e3:8.1f} ms (mín)  {entry['mean_s'] * 1e3:8.1f} ms (média)  "
+              f"pesados: {heavy}")
+
+    report = {
+        'meta': {
+            'revision': git_revision(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': sys.version.split()[0]
+        },
+        'results': results
+    }
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        compare(results, args.compare)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import math
+import random
+
+# Área de planta reservada por mesa (em unidades²), folgada o bastante para caber cadeiras e espaçamento
+AREA_PER_TABLE = 150
+
+
+def make_config(n_tables, seed=0, aspect=1.5, restrictions=None):
+    """Gera uma planta sintética no mesmo formato de config/config.json.
+
+    A planta cresce com o número de mesas, tem paredes, um banheiro com área de porta
+    e algumas áreas restritas aleatórias; 1 em cada 5 mesas é uma mesa grande (20x3).
+    """
+    rng = random.Random(seed)
+    altura = max(40, int(math.sqrt(n_tables * AREA_PER_TABLE / aspect)))
+    largura = max(60, int(altura * aspect))
+
+    elementos = [
+        {'id': 'parede_esquerda', 'tipo': 'parede', 'w': 1, 'h': altura, 'x': 0, 'y': 0, 'fixo': True},
+        {'id': 'parede_direita', 'tipo': 'parede', 'w': 1, 'h': altura, 'x': largura - 1, 'y': 0, 'fixo': True},
+        {'id': 'parede_superior', 'tipo': 'parede', 'w': largura, 'h': 1, 'x': 0, 'y': 0, 'fixo': True},
+        {'id': 'parede_inferior', 'tipo': 'parede', 'w': largura, 'h': 1, 'x': 0, 'y': altura - 1, 'fixo': True},
+        {'id': 'banheiro', 'tipo': 'banheiro', 'w': 6, 'h': 10, 'x': 0, 'y': 0, 'fixo': True},
+        {'id': 'area_porta_banheiro', 'tipo': 'restricao', 'w': 6, 'h': 2, 'x': 0, 'y': 10, 'fixo': True},
+    ]
+    if restrictions is None:
+        restrictions = max(1, n_tables // 100)
+    for i in range(restrictions):
+        w, h = rng.randint(2, 8), rng.randint(2, 8)
+        elementos.append({
+            'id': f'restricao_{i + 1}', 'tipo': 'restricao', 'w': w, 'h': h,
+            'x': rng.randint(10, largura - w - 10), 'y': rng.randint(10, altura - h - 10), 'fixo': True
+        })
+    for i in range(n_tables):
+        elementos.append({'id': f'mesa_{i + 1}', 'tipo': 'mesa', 'w': 20 if i % 5 == 4 else 10, 'h': 3})
+
+    return {'planta': {'largura': largura, 'altura': altura, 'elementos': elementos}}
@@ -0,0 +1,203 @@
+"""Otimização em lote de vários andares (ou plantas) com fila de jobs e pool de processos.
+
+Aceita arquivos de configuração de uma planta, diretórios com esses arquivos e
+configurações de prédio com vários andares:
+
+    {
+        "algoritmo": {...},                    # parâmetros comuns a todos os andares
+        "andares": [
+            {"nome": "1º andar", "planta": {...}, "algoritmo": {...}, "prioridade": 2, "tempo_limite": 60},
+            ...
+        ]
+    }
+
+Jobs com maior `prioridade` saem da fila primeiro. Cada job tem um tempo limite opcional
+(`tempo_limite`, em segundos, ou o padrão de --time-budget).
+
+Uso:
+    python -m core.batch config/predio.json plantas/ --workers 8 --time-budget 120 --out resultados/
+"""
+import argparse
+import hashlib
+import heapq
+import json
+import os
+import re
+import time
+
+from core.config import build_layout, build_genetic, get_params, load_config, split_elements
+from core.run import run_optimization, save_result
+from core.utils import json_files
+
+# Chave da lista de andares em uma configuração de prédio
+FLOORS_KEY = 'andares'
+
+# Layouts já construídos no processo worker, por geometria da planta
+_layout_cache = {}
+
+
+def load_jobs(sources, time_budget=None, seed=None):
+    """Monta a lista de jobs (um por andar/planta) a partir de arquivos e diretórios"""
+    jobs = []
+
+    def add(name, config, spec):
+        jobs.append({
+            'name': name,
+            'config': config,
+            'priority': spec.get('prioridade', 0),
+            'time_budget': spec.get('tempo_limite', time_budget),
+            'seed': None if seed is None else seed + len(jobs)
+        })
+
+    for path in json_files(sources):
+        config = load_config(path)
+        stem = os.path.splitext(os.path.basename(path))[0]
+        if FLOORS_KEY not in config:
+            add(stem, config, config)
+            continue
+        shared = config.get('algoritmo', {})
+        for i, floor in enumerate(config[FLOORS_KEY]):
+            floor_config = {'planta': floor['planta'], 'algoritmo': {**shared, **floor.get('algoritmo', {})}}
+            add(floor.get('nome', f"{stem}_{i + 1}"), floor_config, floor)
+    return jobs
+
+
+def geometry_key(planta, spacing):
+    """Identifica plantas com a mesma geometria (dimensões, elementos fixos e espaçamento)"""
+    fixed_elements, _ = split_elements(planta)
+    geometry = {
+        'largura': planta['largura'],
+        'altura': planta['altura'],
+        'fixos': sorted(json.dumps(elem, sort_keys=True) for elem in fixed_elements),
+        'spacing': spacing
+    }
+    return hashlib.blake2b(json.dumps(geometry, sort_keys=True).encode(), digest_size=16).hexdigest()
+
+
+def cached_layout(config):
+    """Layout da planta, reaproveitando o de um andar anterior com a mesma geometria neste processo.
+
+    Retorna (layout, reaproveitado).
+    """
+    planta = config['planta']
+    spacing = get_params(config)['spacing']
+    key = geometry_key(planta, spacing)
+    layout = _layout_cache.get(key)
+    if layout is None:
+        layout = _layout_cache[key] = build_layout(planta, spacing)
+        return layout, False
+    _, movable_tables = split_elements(planta)
+    return layout.with_tables(planta, movable_tables), True
+
+
+def run_batch_job(job):
+    """Otimiza um andar dentro do tempo limite do job"""
+    layout, reused = cached_layout(job['config'])
+    genetic = build_genetic(job['config'], layout=layout, seed=job['seed'])
+    try:
+        result = run_optimization(genetic, time_budget=job['time_budget'])
+    finally:
+        genetic.close()
+    result['name'] = job['name']
+    result['seed'] = job['seed']
+    result['layout_reused'] = reused
+    result['worker_pid'] = os.getpid()
+    return result
+
+
+def _result_file(name, used):
+    """Nome de arquivo único e seguro para o resultado de um job"""
+    base = re.sub(r'[^\w.-]+', '_', name).strip('_') or 'andar'
+    filename, n = f"{base}.json", 1
+    while filename in used:
+        n += 1
+        filename = f"{base}_{n}.json"
+    used.add(filename)
+    return filename
+
+
+def run_batch(jobs, out_dir, workers=None):
+    """Executa a fila de jobs em um pool de processos e grava os resultados e o index.json em out_dir.
+
+    No máximo `workers` jobs ficam em execução; quando um termina, o próximo de maior
+    prioridade é enviado. Falhas de um job ficam registradas no índice sem interromper os demais.
+    """
+    workers = workers or os.cpu_count() or 1
+    os.makedirs(out_dir, exist_ok=True)
+    start = time.perf_counter()
+
+    queue = [(-job['priority'], order, job) for order, job in enumerate(jobs)]
+    heapq.heapify(queue)
+    entries = [None] * len(jobs)
+    used = {'index.json'}
+
+    def record(order, job, result=None, error=None):
+        entry = {'name': job['name'], 'priority': job['priority'], 'time_budget': job['time_budget']}
+        if error is not None:
+            entry['error'] = error
+        else:
+            entry['file'] = _result_file(job['name'], used)
+            save_result(result, os.path.join(out_dir, entry['file']))
+            entry.update({key: result[key] for key in (
+                'best_fitness', 'generations', 'stop_reason', 'elapsed_seconds', 'layout_reused'
+            )})
+        entries[order] = entry
+        status = entry.get('error') or f"fitness {entry['best_fitness']:.2f} ({entry['stop_reason']})"
+        print(f"[{sum(e is not None for e in entries)}/{len(jobs)}] {job['name']}: {status}")
+
+    if workers == 1:
+        while queue:
+            _, order, job = heapq.heappop(queue)
+            try:
+                record(order, job, run_batch_job(job))
+            except Exception as e:
+                record(order, job, error=f"{type(e).__name__}: {e}")
+    else:
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            running = {}
+            while queue or running:
+                while queue and len(running) < workers:
+                    _, order, job = heapq.heappop(queue)
+                    running[pool.submit(run_batch_job, job)] = (order, job)
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    order, job = running.pop(future)
+                    try:
+                        record(order, job, future.result())
+                    except Exception as e:
+                        record(order, job, error=f"{type(e).__name__}: {e}")
+
+    index = {
+        'workers': workers,
+        'total_seconds': time.perf_counter() - start,
+        'jobs': entries
+    }
+    with open(os.path.join(out_dir, 'index.json'), 'w') as f:
+        json.dump(index, f, indent=2, ensure_ascii=False)
+    return index
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Otimização em lote de vários andares ou plantas")
+    parser.add_argument('sources', nargs='+', help="Configurações de planta, de prédio (com \"andares\") ou diretórios")
+    parser.add_argument('--workers', type=int, default=None, help="Processos em paralelo (padrão: todos os núcleos)")
+    parser.add_argument('--time-budget', type=float, help="Tempo limite padrão por job, em segundos")
+    parser.add_argument('--seed', type=int, default=None, help="Semente base (cada job usa seed + i)")
+    parser.add_argument('--out', default='resultados', help="Diretório de saída")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    jobs = load_jobs(args.sources, time_budget=args.time_budget, seed=args.seed)
+    index = run_batch(jobs, args.out, workers=args.workers)
+    failed = sum('error' in entry for entry in index['jobs'])
+    print(f"{len(jobs)} jobs em {index['total_seconds']:.2f}s com {index['workers']} processos "
+          f"({failed} com erro) -> {os.path.join(args.out, 'index.json')}")
+    return index
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+
+class FitnessCache:
+    """Cache LRU de fitness indexado por um hash canônico das posições e rotações das mesas"""
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    @staticmethod
+    def key(genes):
+        """Hash de 128 bits dos bytes do array de genes (x, y, rotação)"""
+        return hashlib.blake2b(np.ascontiguousarray(genes).tobytes(), digest_size=16).digest()
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get(self, key):
+        """Retorna o fitness guardado (ou None) e atualiza os contadores"""
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Guarda um fitness, descartando o item usado há mais tempo quando o cache está cheio"""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        """Esvazia o cache e zera os contadores"""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
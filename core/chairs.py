@@ -0,0 +1,69 @@
+import numpy as np
+
+# Profundidade da faixa livre para as cadeiras em cada lado da mesa que tem cadeiras
+CHAIR_SPACE = 1.5
+
+
+def chair_count(table):
+    """Cadeiras de um tipo de mesa, pelas dimensões base: valor "cadeiras" do JSON ou 4 para largura 20, 2 para as demais"""
+    return table.get('cadeiras', 4 if table['w'] == 20 else 2)
+
+
+def chair_strips(x, y, w, h, rot, chair_space=CHAIR_SPACE):
+    """Retângulos (x, y, w, h) das duas faixas de cadeiras de uma mesa.
+
+    As cadeiras ficam nos lados longos da mesa na orientação base (em cima e embaixo);
+    com a mesa rotacionada passam para a esquerda e a direita.
+    """
+    first = (np.where(rot, x - chair_space, x), np.where(rot, y, y - chair_space),
+             np.where(rot, chair_space, w), np.where(rot, h, chair_space))
+    second = (np.where(rot, x + w, x), np.where(rot, y, y + h),
+              np.where(rot, chair_space, w), np.where(rot, h, chair_space))
+    return first, second
+
+
+def _areas_array(areas):
+    if len(areas) and isinstance(areas[0], dict):
+        areas = [[area['x'], area['y'], area['w'], area['h']] for area in areas]
+    return np.asarray(areas, dtype=np.float64).reshape(-1, 4)
+
+
+def chair_clearance(x, y, w, h, rot, largura, altura, chair_space=CHAIR_SPACE, areas=()):
+    """Verifica se as faixas das cadeiras cabem na planta e não invadem as áreas restritas.
+
+    `areas` aceita a lista de dicts de áreas restritas ou um array (k, 4) com x, y, w, h.
+    Aceita escalares ou arrays (com broadcast do NumPy). A distância às outras mesas fica
+    por conta do espaçamento entre mesas.
+    """
+    vertical = (y >= chair_space) & (y + h <= altura - chair_space)
+    horizontal = (x >= chair_space) & (x + w <= largura - chair_space)
+    clear = np.where(rot, horizontal, vertical)
+    areas = _areas_array(areas)
+    if len(areas):
+        ax, ay, aw, ah = (areas[:, k] for k in range(4))
+        for sx, sy, sw, sh in chair_strips(x, y, w, h, rot, chair_space):
+            sx, sy, sw, sh = (np.asarray(v)[..., None] for v in (sx, sy, sw, sh))
+            hits = ~((sx + sw <= ax) | (ax + aw <= sx) | (sy + sh <= ay) | (ay + ah <= sy))
+            clear = clear & ~hits.any(axis=-1)
+    return clear
+
+
+def _spread(count):
+    return [(2 * i + 1) / (2 * count) for i in range(count)]
+
+
+def chair_positions(table):
+    """Centros das cadeiras de uma mesa posicionada (dict com x, y, w, h e, opcionalmente, rot e cadeiras)"""
+    count = table.get('cadeiras', chair_count(table))
+    if count == 2:
+        # Uma cadeira de cada lado, desencontradas
+        first, second = [1 / 3], [2 / 3]
+    else:
+        first, second = _spread((count + 1) // 2), _spread(count // 2)
+
+    x, y, w, h = table['x'], table['y'], table['w'], table['h']
+    if table.get('rot', 0):
+        return ([(x - 0.5, y + f * h) for f in first] +
+                [(x + w + 0.5, y + f * h) for f in second])
+    return ([(x + f * w, y - 0.5) for f in first] +
+            [(x + f * w, y + h + 0.5) for f in second])
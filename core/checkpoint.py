@@ -0,0 +1,86 @@
+import json
+import os
+
+import numpy as np
+
+from core.utils import ensure_parent_dir
+
+# Versão do formato do arquivo de checkpoint (a versão 2 inclui o gerador do NumPy e a 3, o
+# estado do ConvergenceMonitor)
+CHECKPOINT_VERSION = 3
+SUPPORTED_VERSIONS = (1, 2, 3)
+
+
+def save_checkpoint(genetic, path):
+    """Grava o estado do algoritmo genético em um .npz binário (sem compressão, para ser rápido).
+
+    A escrita vai para um arquivo temporário e só então substitui o anterior, então uma
+    interrupção no meio da gravação nunca corrompe o último checkpoint válido.
+    """
+    version, internal_state, gauss_next = genetic.rng.getstate()
+    best_genes = genetic.best_genes if genetic.best_genes is not None else genetic.genome.empty()[:0]
+    convergence = {}
+    if genetic.convergence is not None:
+        convergence = {f"convergence_{key}": value for key, value in genetic.convergence.state().items()}
+
+    ensure_parent_dir(path)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        np.savez(
+            f,
+            format_version=CHECKPOINT_VERSION,
+            population=np.asarray(genetic.population),
+            best_genes=best_genes,
+            best_fitness=genetic.best_fitness,
+            generation=genetic.generation,
+            last_improvement=genetic.last_improvement,
+            mutation_rate=genetic.mutation_rate,
+            fitness_history=np.asarray(genetic.fitness_history, dtype=np.float64),
+            history_offset=genetic.history_offset,
+            rng_version=version,
+            rng_state=np.asarray(internal_state, dtype=np.uint32),
+            rng_gauss=np.nan if gauss_next is None else gauss_next,
+            # Estado do PCG64 com inteiros de 128 bits, guardado como JSON
+            np_rng_state=json.dumps(genetic.np_rng.bit_generator.state),
+            **convergence
+        )
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(genetic, path):
+    """Restaura no algoritmo genético o estado gravado por save_checkpoint"""
+    with np.load(path) as data:
+        if int(data['format_version']) not in SUPPORTED_VERSIONS:
+            raise ValueError(f"Versão de checkpoint não suportada: {int(data['format_version'])}")
+        population = data['population']
+        if population.shape != genetic.buffers.current.shape:
+            raise ValueError(
+                f"Checkpoint incompatível: população {population.shape}, esperado {genetic.buffers.current.shape}"
+            )
+
+        genetic.population = genetic.buffers.load(population)
+        best_genes = data['best_genes']
+        if len(best_genes):
+            genetic.set_best(best_genes, float(data['best_fitness']))
+        else:
+            genetic.best_fitness = -float('inf')
+            genetic.best_genes = None
+            genetic.best_individual = None
+        genetic.generation = int(data['generation'])
+        genetic.last_improvement = int(data['last_improvement'])
+        genetic.mutation_rate = float(data['mutation_rate'])
+        genetic.fitness_history = data['fitness_history'].tolist()
+        genetic.history_offset = int(data['history_offset']) if 'history_offset' in data else 0
+
+        gauss = float(data['rng_gauss'])
+        genetic.rng.setstate((
+            int(data['rng_version']),
+            tuple(int(v) for v in data['rng_state']),
+            None if np.isnan(gauss) else gauss
+        ))
+        if 'np_rng_state' in data:
+            genetic.np_rng.bit_generator.state = json.loads(str(data['np_rng_state']))
+        if genetic.convergence is not None and 'convergence_best_history' in data:
+            genetic.convergence.load_state(data['convergence_best_history'],
+                                           float(data['convergence_base_mutation_rate']),
+                                           bool(data['convergence_boosted']))
@@ -0,0 +1,68 @@
+import json
+
+from core.layout import Layout
+
+# Parâmetros padrão do algoritmo genético; a seção opcional "algoritmo" do JSON sobrescreve estes valores
+DEFAULT_PARAMS = {
+    'max_generations': 300,     # Critério 1: Número máximo de gerações
+    'target_fitness': 450,      # Critério 2: Fitness desejado
+    'stagnation_limit': 100,    # Critério 3: Gerações sem melhoria
+    'selection_method': "tournament",
+    'population_size': 40,
+    'mutation_rate': 0.1,
+    'spacing': 2
+}
+
+
+def load_config(config_file):
+    """Lê o arquivo JSON de configuração da planta"""
+    with open(config_file) as f:
+        return json.load(f)
+
+
+def split_elements(planta):
+    """Separa os elementos fixos das mesas móveis"""
+    fixed_elements = [elem for elem in planta['elementos'] if elem.get('fixo', False)]
+    movable_tables = [elem for elem in planta['elementos'] if elem['tipo'] == 'mesa']
+    return fixed_elements, movable_tables
+
+
+def get_params(config, **overrides):
+    """Combina os parâmetros padrão, a seção "algoritmo" do JSON e os valores informados (não None)"""
+    params = dict(DEFAULT_PARAMS)
+    params.update(config.get('algoritmo', {}))
+    params.update({key: value for key, value in overrides.items() if value is not None})
+    return params
+
+
+def build_layout(planta, spacing):
+    """Cria o Layout de uma planta"""
+    fixed_elements, movable_tables = split_elements(planta)
+    return Layout(
+        planta=planta,
+        fixed_elements=fixed_elements,
+        movable_tables=movable_tables,
+        spacing=spacing
+    )
+
+
+def build_genetic(config, layout=None, **overrides):
+    """Cria o Layout e o GeneticAlgorithm diretamente a partir do JSON, sem dependências gráficas"""
+    from core.genetics import GeneticAlgorithm
+
+    params = get_params(config, **overrides)
+    spacing = params.pop('spacing')
+    mutation_rate = params.pop('mutation_rate')
+    planta = config['planta']
+    if layout is None:
+        layout = build_layout(planta, spacing)
+
+    return GeneticAlgorithm(
+        planta=planta,
+        movable_tables=layout.movable_tables,
+        restricted_areas=layout.restricted_areas,
+        spacing=spacing,
+        mutation_rate=mutation_rate,
+        layout=layout,
+        **params
+    )
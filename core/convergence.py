@@ -0,0 +1,106 @@
+from collections import deque
+
+import numpy as np
+
+
+def population_diversity(population, planta, sample_size=32):
+    """Distância média normalizada entre pares de genomas de uma amostra determinística da população"""
+    population = np.asarray(population)
+    if len(population) < 2:
+        return 0.0
+    step = max(1, len(population) // sample_size)
+    sample = population[::step][:sample_size].astype(np.float64)
+    scale = np.array([planta['largura'], planta['altura'], 1.0])
+    sample /= scale
+    diff = np.abs(sample[:, None] - sample[None, :]).mean(axis=(2, 3))
+    k = len(sample)
+    return float(diff.sum() / (k * (k - 1)))
+
+
+class ConvergenceMonitor:
+    """Detecção de convergência e parada antecipada adaptativa para o GeneticAlgorithm.
+
+    A cada geração acompanha o melhor fitness já encontrado, a inclinação do
+    `fitness_history` e a diversidade da população (distância média entre genomas).
+    Para quando a melhoria relativa do melhor fitness em `window` gerações fica abaixo
+    de `min_relative_improvement` (ou a inclinação abaixo de `min_slope`), e aumenta a
+    taxa de mutação enquanto a diversidade estiver abaixo de `diversity_threshold`.
+    """
+
+    def __init__(self, window=30, min_relative_improvement=1e-3, min_slope=None,
+                 diversity_threshold=0.02, mutation_boost=2.0, max_mutation_rate=0.5,
+                 diversity_sample=32):
+        self.window = window
+        self.min_relative_improvement = min_relative_improvement
+        self.min_slope = min_slope
+        self.diversity_threshold = diversity_threshold
+        self.mutation_boost = mutation_boost
+        self.max_mutation_rate = max_mutation_rate
+        self.diversity_sample = diversity_sample
+
+        self.best_history = deque(maxlen=window + 1)
+        self.base_mutation_rate = None
+        self.diversity = None
+        self.slope = None
+        self.boosted = False
+
+    def state(self):
+        """Estado entre gerações, gravado no checkpoint para que a retomada continue igual"""
+        return {
+            'best_history': np.asarray(self.best_history, dtype=np.float64),
+            'base_mutation_rate': np.nan if self.base_mutation_rate is None else self.base_mutation_rate,
+            'boosted': self.boosted
+        }
+
+    def load_state(self, best_history, base_mutation_rate, boosted):
+        """Restaura o estado gravado por state()"""
+        self.best_history = deque((float(v) for v in best_history), maxlen=self.window + 1)
+        self.base_mutation_rate = None if np.isnan(base_mutation_rate) else float(base_mutation_rate)
+        self.boosted = bool(boosted)
+
+    def reset(self, genetic):
+        """Volta ao estado inicial e restaura a taxa de mutação original do algoritmo"""
+        if self.base_mutation_rate is not None:
+            genetic.mutation_rate = self.base_mutation_rate
+        self.best_history.clear()
+        self.base_mutation_rate = None
+        self.diversity = None
+        self.slope = None
+        self.boosted = False
+
+    def measure_diversity(self, genetic):
+        """Distância média normalizada entre pares de genomas (amostra determinística da população)"""
+        return population_diversity(genetic.population, genetic.planta, self.diversity_sample)
+
+    def update(self, genetic):
+        """Atualiza as métricas após uma geração; retorna o motivo de parada ou None"""
+        if self.base_mutation_rate is None:
+            self.base_mutation_rate = genetic.mutation_rate
+
+        self.best_history.append(genetic.best_fitness)
+        self.diversity = self.measure_diversity(genetic)
+
+        # Reforça a mutação quando a população colapsa e volta ao valor original depois
+        if self.diversity < self.diversity_threshold:
+            genetic.mutation_rate = min(self.base_mutation_rate * self.mutation_boost, self.max_mutation_rate)
+            self.boosted = True
+        elif self.boosted:
+            genetic.mutation_rate = self.base_mutation_rate
+            self.boosted = False
+
+        history = genetic.fitness_history
+        if len(history) >= self.window:
+            recent = np.asarray(history[-self.window:], dtype=np.float64)
+            self.slope = float(np.polyfit(np.arange(self.window), recent, 1)[0])
+
+        if len(self.best_history) <= self.window:
+            return None
+
+        old, new = self.best_history[0], self.best_history[-1]
+        improvement = (new - old) / max(abs(old), 1e-12)
+        if improvement < self.min_relative_improvement:
+            return (f"Melhoria relativa abaixo de {self.min_relative_improvement:.2%} "
+                    f"nas últimas {self.window} gerações")
+        if self.min_slope is not None and self.slope is not None and self.slope < self.min_slope:
+            return f"Inclinação do fitness abaixo de {self.min_slope} nas últimas {self.window} gerações"
+        return None
@@ -0,0 +1,154 @@
+import numpy as np
+
+from core.chairs import chair_clearance
+from core.genome import ROT
+
+
+class IncrementalFitness:
+    """Fitness de um único indivíduo com atualização incremental (delta) em O(n).
+
+    Guarda as somas parciais da função de fitness (mesas inválidas, violações de
+    cadeira, colisões, soma das distâncias, mínimos por linha, centralidade, área
+    usada e capacidade de cadeiras). Mover ou rotacionar uma mesa com `move` só
+    recalcula a linha dessa mesa nas matrizes de colisão e de distância.
+
+    A soma das distâncias é atualizada por diferença, então o score pode divergir do
+    `GeneticAlgorithm.fitness` de referência no último dígito; `reference_score`
+    recalcula o valor completo para conferência.
+    """
+
+    def __init__(self, evaluator, genome, genes):
+        self.evaluator = evaluator
+        self.genome = genome
+        self.genes = np.array(genes, copy=True)
+        self.n = len(self.genes)
+
+        rects = genome.rects(self.genes).astype(np.float64)
+        self.x, self.y, self.w, self.h = (rects[:, k].copy() for k in range(4))
+        self.rot = self.genes[:, ROT].astype(bool)
+
+        self.in_bounds = self._in_bounds(self.x, self.y, self.w, self.h)
+        self.restricted = self._restricted(self.x, self.y, self.w, self.h)
+        self.chair = self._chair(self.x, self.y, self.w, self.h, self.rot)
+
+        x, y, w, h = self.x, self.y, self.w, self.h
+        s = evaluator.spacing
+        self.collide = ~((x[:, None] + w[:, None] + s <= x) | (x + w + s <= x[:, None]) |
+                         (y[:, None] + h[:, None] + s <= y) | (y + h + s <= y[:, None]))
+        np.fill_diagonal(self.collide, False)
+        self.collisions = int((np.triu(self.collide, 1) & self.in_bounds[:, None]).sum())
+
+        cx, cy = x + w / 2, y + h / 2
+        self.dist = np.sqrt((cx[:, None] - cx) ** 2 + (cy[:, None] - cy) ** 2)
+        np.fill_diagonal(self.dist, np.inf)
+        self.total_distance = float(self.dist[np.triu_indices(self.n, k=1)].sum())
+        self.row_min = self.dist.min(axis=1) if self.n else np.zeros(0)
+
+        self.centrality_terms = self._centrality(cx, cy)
+        self.used_area = float((w * h).sum())
+        # Depende só das dimensões base de cada mesa, então não muda com move
+        self.chair_capacity = int(genome.chairs.sum())
+
+    def _in_bounds(self, x, y, w, h):
+        ev = self.evaluator
+        return (0 <= x) & (x <= ev.largura - w) & (0 <= y) & (y <= ev.altura - h)
+
+    def _restricted(self, x, y, w, h):
+        areas = self.evaluator.areas
+        if not len(areas):
+            return np.zeros(np.shape(x), dtype=bool)
+        ax, ay, aw, ah = (areas[:, k] for k in range(4))
+        x, y, w, h = (np.asarray(v)[..., None] for v in (x, y, w, h))
+        return (~((x + w <= ax) | (ax + aw <= x) | (y + h <= ay) | (ay + ah <= y))).any(axis=-1)
+
+    def _chair(self, x, y, w, h, rot):
+        ev = self.evaluator
+        return ~chair_clearance(x, y, w, h, rot, ev.largura, ev.altura, ev.chair_space, ev.areas)
+
+    def _centrality(self, cx, cy):
+        ev = self.evaluator
+        return 1 / (1 + np.abs(cx - ev.largura / 2)) + 1 / (1 + np.abs(cy - ev.altura / 2))
+
+    def _pair_collisions(self, k):
+        """Colisões contadas nos pares que envolvem a mesa k (mesma regra do fitness original)"""
+        count = int((self.collide[:k, k] & self.in_bounds[:k]).sum())
+        if self.in_bounds[k]:
+            count += int(self.collide[k, k + 1:].sum())
+        return count
+
+    @property
+    def invalid_count(self):
+        return int((~self.in_bounds).sum() + (self.in_bounds & self.restricted).sum())
+
+    @property
+    def chair_violations(self):
+        return int((self.in_bounds & self.chair).sum())
+
+    @property
+    def min_distance(self):
+        return float(self.row_min.min()) if self.n > 1 else float('inf')
+
+    def move(self, k, x, y, rot=None):
+        """Move (e opcionalmente rotaciona) a mesa k, atualizando as somas parciais em O(n)"""
+        rot = int(self.genes[k, ROT]) if rot is None else int(rot)
+        w, h = self.genome.table_dims(k, rot)
+        self.genes[k] = (x, y, rot)
+
+        self.collisions -= self._pair_collisions(k)
+        self.used_area -= self.w[k] * self.h[k]
+
+        self.x[k], self.y[k], self.w[k], self.h[k], self.rot[k] = x, y, w, h, rot
+        self.in_bounds[k] = self._in_bounds(x, y, w, h)
+        self.restricted[k] = self._restricted(x, y, w, h)
+        self.chair[k] = self._chair(x, y, w, h, rot)
+        self.used_area += w * h
+
+        s = self.evaluator.spacing
+        row = ~((x + w + s <= self.x) | (self.x + self.w + s <= x) |
+                (y + h + s <= self.y) | (self.y + self.h + s <= y))
+        row[k] = False
+        self.collide[k, :] = row
+        self.collide[:, k] = row
+        self.collisions += self._pair_collisions(k)
+
+        cx, cy = x + w / 2, y + h / 2
+        others = np.arange(self.n) != k
+        old = self.dist[k].copy()
+        new = np.sqrt((self.x + self.w / 2 - cx) ** 2 + (self.y + self.h / 2 - cy) ** 2)
+        new[k] = np.inf
+        self.total_distance += float(np.sum(new, where=others) - np.sum(old, where=others))
+        self.dist[k, :] = new
+        self.dist[:, k] = new
+
+        # Linhas cujo mínimo era a distância até k e que aumentaram precisam ser recalculadas
+        stale = (old == self.row_min) & (new > old) & others
+        self.row_min = np.minimum(self.row_min, new)
+        if stale.any():
+            self.row_min[stale] = self.dist[stale].min(axis=1)
+        self.row_min[k] = new.min()
+
+        self.centrality_terms[k] = self._centrality(cx, cy)
+
+    def score(self):
+        """Fitness atual, calculado a partir das somas parciais"""
+        invalid_count = self.invalid_count
+        chair_violations = self.chair_violations
+        if invalid_count > 0 or chair_violations > 0:
+            penalty = (invalid_count * 100) + (chair_violations * 150) + (self.collisions * 50)
+            return max(1 / (penalty + 1), 0.0001)
+
+        pair_count = self.n * (self.n - 1) // 2
+        avg_distance = self.total_distance / pair_count if pair_count > 0 else 0
+        free_area = (self.evaluator.largura * self.evaluator.altura) - self.used_area
+        density_score = min(self.used_area / free_area, 3)
+
+        return (self.chair_capacity * 10 +
+                self.min_distance * 3 +
+                avg_distance * 1 +
+                float(self.centrality_terms.sum()) * 2 +
+                density_score * 5 +
+                self.n * 2) + 50
+
+    def reference_score(self):
+        """Recalcula o fitness completo dos genes atuais, para conferir o valor incremental"""
+        return float(self.evaluator.evaluate_packed(self.genome.pack([self.genes]))[0])
@@ -0,0 +1,246 @@
+import numpy as np
+
+from core.chairs import CHAIR_SPACE, chair_clearance, chair_count
+
+# Quantidade máxima aproximada de pares (indivíduos x pares de mesas) avaliados por bloco,
+# para limitar a memória das matrizes intermediárias em populações grandes
+PAIR_BLOCK_SIZE = 2_000_000
+
+
+def grid_pairs(px, py, qx, qy, cell):
+    """Pares (i, j) da consulta i e do ponto j em células vizinhas de uma grade uniforme de lado `cell`.
+
+    Dois centros a menos de `cell` em cada eixo sempre caem em células vizinhas, então com
+    `cell` maior que a maior mesa mais o espaçamento os pares cobrem todas as colisões.
+    """
+    if not len(px) or not len(qx):
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    gx, gy = np.floor(px / cell).astype(np.int64), np.floor(py / cell).astype(np.int64)
+    qgx, qgy = np.floor(qx / cell).astype(np.int64), np.floor(qy / cell).astype(np.int64)
+    x0, y0 = min(gx.min(), qgx.min()) - 1, min(gy.min(), qgy.min()) - 1
+    gx, gy, qgx, qgy = gx - x0, gy - y0, qgx - x0, qgy - y0
+    columns = max(gx.max(), qgx.max()) + 2
+    rows = max(gy.max(), qgy.max()) + 2
+    keys = gy * columns + gx
+    order = np.argsort(keys, kind='stable')
+    # Início e tamanho de cada célula no array ordenado, consultados direto pela chave
+    sizes = np.bincount(keys, minlength=rows * columns)
+    starts = np.cumsum(sizes) - sizes
+
+    pairs_i, pairs_j = [], []
+    for dy in (-1, 0, 1):
+        for dx in (-1, 0, 1):
+            target = (qgy + dy) * columns + (qgx + dx)
+            lo = starts[target]
+            counts = sizes[target]
+            total = counts.sum()
+            if not total:
+                continue
+            # Expande cada intervalo [lo, lo + count) do array ordenado
+            offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            pairs_i.append(np.repeat(np.arange(len(qx)), counts))
+            pairs_j.append(order[np.repeat(lo, counts) + offsets])
+    if not pairs_i:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(pairs_i), np.concatenate(pairs_j)
+
+
+class BatchFitnessEvaluator:
+    """Avalia o fitness de uma população inteira de forma vetorizada com NumPy.
+
+    Reproduz exatamente os mesmos valores de `GeneticAlgorithm.fitness`, mas
+    empacotando a população em um array (pop, mesas, 6) com as colunas x, y, w, h,
+    rotação e número de cadeiras.
+    """
+
+    def __init__(self, planta, restricted_areas, spacing, chair_space=CHAIR_SPACE):
+        self.largura = planta['largura']
+        self.altura = planta['altura']
+        self.spacing = spacing
+        self.chair_space = chair_space
+        self.areas = np.array(
+            [[area['x'], area['y'], area['w'], area['h']] for area in restricted_areas],
+            dtype=np.float64
+        ).reshape(-1, 4)
+
+    def pack(self, population):
+        """Converte uma lista de indivíduos (listas de dicts) em um array (pop, mesas, 6)"""
+        return np.array(
+            [[[t['x'], t['y'], t['w'], t['h'], t.get('rot', 0), t.get('cadeiras', chair_count(t))]
+              for t in individual] for individual in population],
+            dtype=np.float64
+        ).reshape(len(population), -1, 6)
+
+    def evaluate(self, population):
+        """Retorna a lista de fitness de todos os indivíduos da população"""
+        packed = population if isinstance(population, np.ndarray) else self.pack(population)
+        return self.evaluate_packed(packed).tolist()
+
+    def evaluate_packed(self, packed):
+        """Calcula o fitness de um array (pop, mesas, 6) em blocos vetorizados"""
+        packed = np.asarray(packed, dtype=np.float64)
+        pop_size, n_tables = packed.shape[0], packed.shape[1]
+        scores = np.empty(pop_size, dtype=np.float64)
+        if pop_size == 0:
+            return scores
+
+        pairs_i, pairs_j = np.triu_indices(n_tables, k=1)
+        block = max(1, PAIR_BLOCK_SIZE // max(len(pairs_i), n_tables, 1))
+        for start in range(0, pop_size, block):
+            end = min(start + block, pop_size)
+            scores[start:end] = self._evaluate_block(packed[start:end], pairs_i, pairs_j)
+        return scores
+
+    def _evaluate_block(self, packed, pairs_i, pairs_j):
+        x, y, w, h = packed[..., 0], packed[..., 1], packed[..., 2], packed[..., 3]
+        rot, chairs = packed[..., 4] != 0, packed[..., 5]
+        n_tables = packed.shape[1]
+
+        # Limites da planta
+        in_bounds = ((0 <= x) & (x <= self.largura - w) &
+                     (0 <= y) & (y <= self.altura - h))
+
+        # Colisão com áreas restritas (mesas fora da planta já foram contadas como inválidas)
+        if len(self.areas):
+            ax, ay, aw, ah = (self.areas[:, k] for k in range(4))
+            hits = ~((x[..., None] + w[..., None] <= ax) | (ax + aw <= x[..., None]) |
+                     (y[..., None] + h[..., None] <= ay) | (ay + ah <= y[..., None]))
+            restricted_hit = hits.any(axis=-1)
+        else:
+            restricted_hit = np.zeros_like(in_bounds)
+        invalid_count = (~in_bounds).sum(axis=1) + (in_bounds & restricted_hit).sum(axis=1)
+
+        chair_violations = (in_bounds & ~chair_clearance(x, y, w, h, rot, self.largura, self.altura,
+                                                         self.chair_space, self.areas)).sum(axis=1)
+        penalized = (invalid_count > 0) | (chair_violations > 0)
+
+        # Colisões entre pares (i < j), contadas apenas quando a mesa i está dentro da planta.
+        # Só entram na penalidade, então são calculadas apenas para os indivíduos penalizados
+        collisions = np.zeros(len(packed), dtype=np.int64)
+        rows = np.flatnonzero(penalized)
+        if len(rows) and n_tables > 1:
+            collisions[rows] = self._collisions(x[rows], y[rows], w[rows], h[rows], in_bounds[rows],
+                                                pairs_i, pairs_j)
+
+        penalty = (invalid_count * 100) + (chair_violations * 150) + (collisions * 50)
+        penalty_score = np.maximum(1 / (penalty + 1), 0.0001)
+
+        # Pontuação dos layouts válidos (distâncias calculadas só para os não penalizados)
+        chair_capacity = chairs.sum(axis=1)
+
+        cx, cy = x + w / 2, y + h / 2
+        min_distance = np.full(len(packed), float('inf'))
+        avg_distance = np.zeros(len(packed))
+        rows = np.flatnonzero(~penalized)
+        if len(rows) and n_tables > 1:
+            min_distance[rows], avg_distance[rows] = self._distances(cx[rows], cy[rows], w[rows], h[rows],
+                                                                     pairs_i, pairs_j)
+
+        center_x, center_y = self.largura / 2, self.altura / 2
+        centrality_terms = (1 / (1 + np.abs(cx - center_x)) +
+                            1 / (1 + np.abs(cy - center_y)))
+        centrality = np.cumsum(centrality_terms, axis=1)[:, -1] if n_tables else np.zeros(len(packed))
+
+        used_area = (w * h).sum(axis=1)
+        free_area = (self.largura * self.altura) - used_area
+        with np.errstate(divide='ignore', invalid='ignore'):
+            density_score = np.minimum(used_area / free_area, 3)
+
+        score = (chair_capacity * 10 +
+                 min_distance * 3 +
+                 avg_distance * 1 +
+                 centrality * 2 +
+                 density_score * 5 +
+                 n_tables * 2)
+        score = score + 50
+
+        return np.where(penalized, penalty_score, score)
+
+    def _collisions(self, x, y, w, h, in_bounds, pairs_i, pairs_j):
+        """Colisões (com espaçamento) de cada indivíduo, considerando todos os pares de mesas"""
+        s = self.spacing
+        xi, yi, wi, hi = x[:, pairs_i], y[:, pairs_i], w[:, pairs_i], h[:, pairs_i]
+        xj, yj, wj, hj = x[:, pairs_j], y[:, pairs_j], w[:, pairs_j], h[:, pairs_j]
+        pair_collision = ~((xi + wi + s <= xj) | (xj + wj + s <= xi) |
+                           (yi + hi + s <= yj) | (yj + hj + s <= yi))
+        return (pair_collision & in_bounds[:, pairs_i]).sum(axis=1)
+
+    def _distances(self, cx, cy, w, h, pairs_i, pairs_j):
+        """Distância mínima e média entre os centros de todos os pares de mesas de cada indivíduo"""
+        # float_power chama o pow da libm, como o `** 0.5` de Layout.calculate_distance
+        # (o operador ** do NumPy troca o expoente 0.5 por sqrt, que difere no último bit)
+        dist = np.float_power((cx[:, pairs_i] - cx[:, pairs_j]) ** 2 +
+                              (cy[:, pairs_i] - cy[:, pairs_j]) ** 2, 0.5)
+        # Soma acumulada sequencial para manter a mesma ordem de arredondamento do laço original
+        return dist.min(axis=1), np.cumsum(dist, axis=1)[:, -1] / len(pairs_i)
+
+
+class NeighborFitnessEvaluator(BatchFitnessEvaluator):
+    """Variante do avaliador em lote para plantas grandes (milhares de mesas).
+
+    Em vez de todos os n * (n - 1) / 2 pares, considera apenas as mesas das células
+    vizinhas de uma grade uniforme sobre os centros. O lado da célula nunca é menor que a
+    maior mesa mais o espaçamento, então as colisões continuam exatas; a distância mínima
+    passa a ser a menor entre vizinhas e a distância média vira a média das distâncias de
+    cada mesa às suas `neighbors` vizinhas mais próximas.
+    """
+
+    def __init__(self, planta, restricted_areas, spacing, chair_space=CHAIR_SPACE, neighbors=8):
+        super().__init__(planta, restricted_areas, spacing, chair_space)
+        if neighbors < 1:
+            raise ValueError(f"Número de vizinhas inválido: {neighbors}")
+        self.neighbors = neighbors
+
+    def evaluate_packed(self, packed):
+        """Calcula o fitness de um array (pop, mesas, 6) sem montar a lista de todos os pares"""
+        packed = np.asarray(packed, dtype=np.float64)
+        pop_size, n_tables = packed.shape[0], packed.shape[1]
+        scores = np.empty(pop_size, dtype=np.float64)
+        if pop_size == 0:
+            return scores
+
+        # Os pares candidatos são montados por indivíduo; o bloco só limita as matrizes por mesa
+        block = max(1, PAIR_BLOCK_SIZE // max(n_tables * 9 * self.neighbors, 1))
+        for start in range(0, pop_size, block):
+            end = min(start + block, pop_size)
+            scores[start:end] = self._evaluate_block(packed[start:end], None, None)
+        return scores
+
+    def candidate_pairs(self, cx, cy, w, h):
+        """Pares (i < j) de mesas de um indivíduo em células vizinhas da grade"""
+        n = len(cx)
+        cell = max(float(max(w.max(), h.max())) + self.spacing,
+                   np.sqrt(self.largura * self.altura * self.neighbors / n))
+        pairs_i, pairs_j = grid_pairs(cx, cy, cx, cy, cell)
+        keep = pairs_i < pairs_j
+        return pairs_i[keep], pairs_j[keep]
+
+    def _collisions(self, x, y, w, h, in_bounds, pairs_i, pairs_j):
+        collisions = np.empty(len(x), dtype=np.int64)
+        for r in range(len(x)):
+            pi, pj = self.candidate_pairs(x[r] + w[r] / 2, y[r] + h[r] / 2, w[r], h[r])
+            collisions[r] = super()._collisions(x[r:r + 1], y[r:r + 1], w[r:r + 1], h[r:r + 1],
+                                                in_bounds[r:r + 1], pi, pj)[0]
+        return collisions
+
+    def _distances(self, cx, cy, w, h, pairs_i, pairs_j):
+        n = cx.shape[1]
+        min_distance = np.empty(len(cx))
+        avg_distance = np.empty(len(cx))
+        for r in range(len(cx)):
+            pi, pj = self.candidate_pairs(cx[r], cy[r], w[r], h[r])
+            if not len(pi):
+                # Mesas espalhadas demais para a grade: volta ao cálculo com todos os pares
+                pi, pj = np.triu_indices(n, k=1)
+            dist = np.float_power((cx[r, pi] - cx[r, pj]) ** 2 + (cy[r, pi] - cy[r, pj]) ** 2, 0.5)
+            min_distance[r] = dist.min()
+
+            # As `neighbors` menores distâncias de cada mesa (cada par conta para as duas mesas)
+            source = np.concatenate((pi, pj))
+            dist = np.concatenate((dist, dist))
+            order = np.lexsort((dist, source))
+            source, dist = source[order], dist[order]
+            starts = np.searchsorted(source, source, side='left')
+            nearest = (np.arange(len(source)) - starts) < self.neighbors
+            avg_distance[r] = dist[nearest].mean()
+        return min_distance, avg_distance
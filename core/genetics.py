@@ -1,10 +1,44 @@
 import random
-import matplotlib.pyplot as plt
-import os
+import time
+from contextlib import nullcontext
+import numpy as np
+from core.fitness import BatchFitnessEvaluator, NeighborFitnessEvaluator, grid_pairs
+from core.genome import GENE_DTYPE, X, Y, ROT, GenomeSpec
+from core.parallel import EvaluationBackend
+from core.cache import FitnessCache
+from core.delta import IncrementalFitness
+from core.population import PopulationBuffer
+from core.checkpoint import load_checkpoint, save_checkpoint
+from core.warmstart import load_layouts, seed_population
+from core.packing import INITIALIZERS, bottom_left_individual
+from core.convergence import population_diversity
+from core.telemetry import TelemetrySink
+from core.plotting import plot_fitness
+from core.chairs import chair_clearance, chair_count
+from core.operators import CROSSOVER_METHODS, crossover_population, select_indices, select_tournament
+from core.local_search import LocalSearch
+
+# Context manager reutilizado quando a instrumentação está desligada
+_NO_PHASE = nullcontext()
+
+# Rodadas de sorteio do mapa de viabilidade para as mesas em conflito no crossover geométrico
+CONFLICT_ATTEMPTS = 3
+
+# Sem ConvergenceMonitor, a telemetria mede a diversidade só a cada tantas gerações (NaN nas demais)
+TELEMETRY_DIVERSITY_EVERY = 10
+
 class GeneticAlgorithm:
     def __init__(self, planta, movable_tables, restricted_areas, spacing, mutation_rate,
                  layout, population_size=30, max_generations=500, target_fitness=500, stagnation_limit=100,
-                 selection_method="rank"):
+                 selection_method="rank", evaluation_backend="serial", workers=None, chunk_size=None,
+                 cache_size=4096, seed=None, instrumentation=None, elitism=0,
+                 checkpoint_path=None, checkpoint_every=0, warm_start=None, warm_start_fraction=0.5,
+                 initializer="random", convergence=None, telemetry=None, history_limit=None,
+                 crossover_method="one_point", distance_neighbors=None, local_search=None):
+        self.rng = random.Random(seed)
+        # Gerador do NumPy para os operadores em lote (seleção e crossover da geração inteira)
+        self.np_rng = np.random.default_rng(seed)
+        self.metrics = instrumentation
         self.planta = planta
         self.movable_tables = movable_tables
         self.restricted_areas = restricted_areas
@@ -16,60 +50,111 @@ class GeneticAlgorithm:
         self.stagnation_limit = stagnation_limit
         self.layout = layout
         self.selection_method = selection_method
+        self.elitism = min(elitism, population_size)
+        if initializer not in INITIALIZERS:
+            raise ValueError(f"Inicializador desconhecido: {initializer}")
+        self.initializer = initializer
+        if crossover_method not in CROSSOVER_METHODS:
+            raise ValueError(f"Método de crossover desconhecido: {crossover_method}")
+        self.crossover_method = crossover_method
+        self.convergence = convergence
+        # Busca local: nome do método, dict de parâmetros (seção "algoritmo" do JSON) ou LocalSearch
+        if isinstance(local_search, str):
+            local_search = LocalSearch(method=local_search)
+        elif isinstance(local_search, dict):
+            local_search = LocalSearch(**local_search)
+        if local_search is not None and distance_neighbors:
+            # A busca local usa o IncrementalFitness, que considera todos os pares e guarda
+            # matrizes n x n: otimizaria outro objetivo e não cabe em memória em plantas grandes
+            raise ValueError("A busca local não pode ser combinada com distance_neighbors")
+        self.local_search = local_search
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
         self.best_fitness = -float("inf")
         self.best_individual = None
+        self.best_genes = None
         self.generation = 0
         self.last_improvement = 0
         self.fitness_history = []
+        # Quantas gerações do histórico ficam em memória (None = todas); a telemetria guarda o resto.
+        # history_offset conta as entradas já descartadas: a geração g fica em fitness_history[g - history_offset]
+        self.history_limit = history_limit
+        self.history_offset = 0
+        self.telemetry = TelemetrySink(telemetry) if isinstance(telemetry, str) else telemetry
+        # Modo para plantas grandes: colisões e distâncias só entre mesas vizinhas
+        self.distance_neighbors = distance_neighbors
+        if distance_neighbors:
+            self.evaluator = NeighborFitnessEvaluator(planta, restricted_areas, spacing, neighbors=distance_neighbors)
+        else:
+            self.evaluator = BatchFitnessEvaluator(planta, restricted_areas, spacing)
+        self.backend = EvaluationBackend(self.evaluator, mode=evaluation_backend,
+                                         workers=workers, chunk_size=chunk_size)
+        self.cache = FitnessCache(cache_size) if cache_size else None
+        self.genome = GenomeSpec(movable_tables)
 
-        self.population = [self.create_individual() for _ in range(self.population_size)]
+        self.buffers = PopulationBuffer(self.population_size, len(self.genome), GENE_DTYPE)
+        self.population = self.buffers.load(self.create_individual() for _ in range(self.population_size))
+        if warm_start:
+            seed_population(self, load_layouts(warm_start), warm_start_fraction)
+
+    def reset(self):
+        """Reinicia a evolução a partir de uma nova população aleatória"""
+        self.population = self.buffers.load(self.create_individual() for _ in range(self.population_size))
+        self.generation = 0
+        self.best_fitness = -float('inf')
+        self.best_individual = None
+        self.best_genes = None
+        self.last_improvement = 0
+        if self.convergence is not None:
+            self.convergence.reset(self)
 
     def create_individual(self):
-        """Cria um indivíduo (layout) aleatório"""
-        individual = []
-        for table in self.movable_tables:
-                placed = False
+        """Cria um indivíduo (layout) aleatório, sorteando as posições dos mapas de viabilidade do Layout"""
+        if self.initializer == "bottom_left":
+            return bottom_left_individual(self)
+
+        genes = self.genome.empty()
+        placed = self.layout.new_table_index()
+        checks = fallbacks = 0
+        for i in range(len(self.genome)):
+                w, h = self.genome.table_dims(i, 0)
+                ok = False
                 attempts = 0
                 
-                while not placed and attempts < 50:
-                    x = random.randint(0, self.planta['largura'] - table['w'])
-                    y = random.randint(0, self.planta['altura'] - table['h'])
-                    
-                    new_table = {
-                        'id': table['id'],
-                        'tipo': table['tipo'],
-                        'w': table['w'],
-                        'h': table['h'],
-                        'x': x,
-                        'y': y
-                    }
+                while not ok and attempts < 50:
+                    position = self.layout.random_position(self.rng, w, h)
+                    if position is None:
+                        break
+                    x, y = position
                     
-                    if self.layout.is_valid_position(new_table, individual):
-                        individual.append(new_table)
-                        placed = True
+                    # A posição já respeita limites, cadeiras e áreas restritas; falta só checar as outras mesas
+                    if not placed.collides(x, y, w, h):
+                        genes[i] = (x, y, 0)
+                        placed.insert(i, x, y, w, h)
+                        ok = True
                     
                     attempts += 1
+                    checks += 1
                 
-                if not placed:
-                    individual.append({
-                        'id': table['id'],
-                        'tipo': table['tipo'],
-                        'w': table['w'],
-                        'h': table['h'],
-                        'x': -10,
-                        'y': -10
-                    })
-            
-        return individual
+                if not ok:
+                    genes[i] = (-10, -10, 0)
+                    placed.insert(i, -10, -10, w, h)
+                    fallbacks += 1
+
+        if self.metrics is not None:
+            self.metrics.count('valid_checks', checks)
+            self.metrics.count('fallback_placements', fallbacks)
+        return genes
 
 
     def fitness(self, individual):
-            """Calcula o fitness de um layout"""
+            """Calcula o fitness de um layout (implementação de referência, um indivíduo por vez)"""
+            if isinstance(individual, np.ndarray):
+                individual = self.genome.decode(individual)
             score = 0
             invalid_count = 0
             collisions = 0
             chair_violations = 0
-            chair_space = 1.5
 
             for i, table in enumerate(individual):
                 if not (0 <= table['x'] <= self.planta['largura'] - table['w'] and
@@ -86,14 +171,16 @@ class GeneticAlgorithm:
                     if self.layout.check_collision(table, individual[j], spacing=self.spacing):
                         collisions += 1
                 
-                if table['y'] < chair_space or table['y'] + table['h'] > self.planta['altura'] - chair_space:
+                if not chair_clearance(table['x'], table['y'], table['w'], table['h'], table.get('rot', 0),
+                                       self.planta['largura'], self.planta['altura'],
+                                       areas=self.restricted_areas):
                     chair_violations += 1
 
             if invalid_count > 0 or chair_violations > 0:
                 penalty = (invalid_count * 100) + (chair_violations * 150) + (collisions * 50)
                 return max(1 / (penalty + 1), 0.0001)
             
-            chair_capacity = sum(4 if table['w'] == 20 else 2 for table in individual)
+            chair_capacity = sum(table.get('cadeiras', chair_count(table)) for table in individual)
             min_distance = float('inf')
             total_distance = 0
             pair_count = 0
@@ -132,113 +219,273 @@ class GeneticAlgorithm:
                 score += 50
             
             return score
+
+    def evaluate_population(self, population):
+        """Calcula o fitness de toda a população em uma única passada vetorizada"""
+        if self.metrics is not None:
+            self.metrics.count('fitness_requests', len(population))
+        if self.cache is None:
+            if self.metrics is not None:
+                self.metrics.count('fitness_evaluations', len(population))
+            return self.backend.evaluate(self.genome.pack(population))
+
+        # Consulta o cache e agrupa os indivíduos repetidos que ainda precisam ser avaliados
+        scores = [None] * len(population)
+        pending = {}
+        for i, individual in enumerate(population):
+            key = self.cache.key(individual)
+            if key in pending:
+                pending[key].append(i)
+                self.cache.hits += 1
+                continue
+            value = self.cache.get(key)
+            if value is None:
+                pending[key] = [i]
+            else:
+                scores[i] = value
+
+        if pending:
+            to_evaluate = [population[positions[0]] for positions in pending.values()]
+            values = self.backend.evaluate(self.genome.pack(to_evaluate))
+            if self.metrics is not None:
+                self.metrics.count('fitness_evaluations', len(to_evaluate))
+            for (key, positions), value in zip(pending.items(), values):
+                self.cache.put(key, value)
+                for i in positions:
+                    scores[i] = value
+        return scores
+
+    def history_since(self, generation):
+        """Entradas do fitness_history a partir da geração informada (as já descartadas não voltam)"""
+        return self.fitness_history[max(generation - self.history_offset, 0):]
+
+    def incremental(self, individual):
+        """Cria o avaliador incremental (delta) de um indivíduo, para movimentos de uma mesa por vez"""
+        return IncrementalFitness(self.evaluator, self.genome, individual)
+
+    def save_checkpoint(self, path=None):
+        """Grava um checkpoint binário (.npz) do estado atual, com a telemetria já gravada até ele"""
+        if self.telemetry is not None:
+            self.telemetry.flush()
+        save_checkpoint(self, path or self.checkpoint_path)
+
+    def load_checkpoint(self, path=None):
+        """Retoma a evolução a partir de um checkpoint gravado por save_checkpoint"""
+        load_checkpoint(self, path or self.checkpoint_path)
+
+    def close(self):
+        """Libera os workers do backend de avaliação e grava a telemetria pendente"""
+        self.backend.close()
+        if self.telemetry is not None:
+            self.telemetry.close()
     
     #outros metodos de seleção para testes
     def selection_tournament(self, population, fitness_scores, k=5):
-        selected = []
-        for _ in range(len(population)):
-            candidates = random.sample(list(zip(population, fitness_scores)), k)
-            winner = max(candidates, key=lambda x: x[1])[0]
-            selected.append(winner)
-        return selected
+        fitness = np.asarray(fitness_scores, dtype=np.float64)
+        return [population[i] for i in select_tournament(self.np_rng, fitness, len(population), k)]
 
     def selection_roulette(self, population, fitness_scores):
-        total_fitness = sum(fitness_scores)
-        if total_fitness == 0:
-            fitness_scores = [1 for _ in fitness_scores]
-            total_fitness = sum(fitness_scores)
-        probs = [f / total_fitness for f in fitness_scores]
-        return random.choices(population, weights=probs, k=len(population))
+        return [population[i] for i in select_indices(self.np_rng, "roulette", fitness_scores, len(population))]
 
     def selection_rank(self, population, fitness_scores):
-        ranked = sorted(zip(population, fitness_scores), key=lambda x: x[1])
-        ranks = list(range(1, len(population)+1))
-        probs = [r / sum(ranks) for r in ranks]
-        return random.choices([ind for ind, _ in ranked], weights=probs, k=len(population))
+        return [population[i] for i in select_indices(self.np_rng, "rank", fitness_scores, len(population))]
 
 
     def selection(self, population, fitness_scores):
-        if self.selection_method == "tournament":
-            return self.selection_tournament(population, fitness_scores)
-        elif self.selection_method == "roulette":
-            return self.selection_roulette(population, fitness_scores)
-        elif self.selection_method == "rank":
-            return self.selection_rank(population, fitness_scores)
-        else:
-            raise ValueError(f"Método de seleção desconhecido: {self.selection_method}")
+        return [population[i] for i in self.selection_indices(fitness_scores, len(population))]
+
+    def selection_indices(self, fitness_scores, count):
+        """Índices dos `count` pais da próxima geração, sorteados em lote pelo método configurado"""
+        return select_indices(self.np_rng, self.selection_method, fitness_scores, count)
 
         
-    def crossover(self, parent1, parent2):
-            """Crossover de ponto único"""
-            point = random.randint(1, len(parent1) - 1)
-            child1 = parent1[:point] + parent2[point:]
-            child2 = parent2[:point] + parent1[point:]
+    def crossover(self, parent1, parent2, out1=None, out2=None):
+            """Crossover de ponto único; os filhos podem ser escritos em arrays já alocados (out1/out2)"""
+            point = self.rng.randint(1, len(parent1) - 1)
+            child1 = np.empty_like(parent1) if out1 is None else out1
+            child2 = np.empty_like(parent2) if out2 is None else out2
+            child1[:point] = parent1[:point]
+            child1[point:] = parent2[point:]
+            child2[:point] = parent2[:point]
+            child2[point:] = parent1[point:]
             return child1, child2
         
+    def resolve_conflicts(self, child, alternative, tables):
+            """Resolve as mesas em conflito de um filho do crossover geométrico (altera o próprio array).
+
+            Em rodadas, as mesas ainda pendentes tentam a cópia do filho, depois a alternativa e
+            depois sorteios do mapa de viabilidade. Uma opção é aceita se for válida e não colidir
+            com as mesas já posicionadas nem com a opção aceitável de uma mesa anterior da mesma
+            rodada; as colisões vêm de uma grade uniforme (grid_pairs), em numpy para todas as
+            pendentes de uma vez. Sem posição livre, a mesa mantém a cópia do filho.
+            """
+            placed = np.ones(len(child), dtype=bool)
+            placed[tables] = False
+            # Linhas x, y, w, h contíguas: as consultas por par leem uma coluna de cada vez
+            rects = self.genome.rects(child).T.copy()
+            s = self.layout.spacing
+            cell = float(max(self.genome.base_w.max(), self.genome.base_h.max())) + s
+
+            pending = tables
+            checks = 0
+            for attempt in range(2 + CONFLICT_ATTEMPTS):
+                if not len(pending):
+                    break
+                options = (alternative if attempt == 1 else child)[pending]
+                w, h = self.genome.dims(options, pending)
+                x, y, rot = options[:, X], options[:, Y], options[:, ROT]
+                if attempt < 2:
+                    ok = self.layout.valid_positions(x, y, w, h, rot)
+                else:
+                    x, y, ok = self.layout.random_positions(self.rng, w, h, rot)
+                checks += len(pending)
+
+                # Candidatas válidas contra as mesas já posicionadas e as candidatas anteriores
+                candidates = np.flatnonzero(ok)
+                others = np.flatnonzero(placed)
+                m = len(others)
+                bx, by, bw, bh = np.concatenate((rects[:, others],
+                                                 np.stack((x, y, w, h))[:, candidates]), axis=1)
+                cx, cy = bx + bw / 2, by + bh / 2
+                qi, pj = grid_pairs(cx, cy, cx[m:], cy[m:], cell)
+                keep = pj < m + qi
+                qi, pj = qi[keep] + m, pj[keep]
+                hits = ~((bx[qi] + bw[qi] + s <= bx[pj]) | (bx[pj] + bw[pj] + s <= bx[qi]) |
+                         (by[qi] + bh[qi] + s <= by[pj]) | (by[pj] + bh[pj] + s <= by[qi]))
+                qi, pj = qi[hits] - m, pj[hits]
+                blocked = np.zeros(len(candidates), dtype=bool)
+                blocked[qi[pj < m]] = True
+                earlier = pj >= m
+                qi, pj = qi[earlier], pj[earlier] - m
+                blocked[qi[~blocked[pj]]] = True
+
+                accepted = np.zeros(len(pending), dtype=bool)
+                accepted[candidates[~blocked]] = True
+                chosen = pending[accepted]
+                child[chosen, X], child[chosen, Y], child[chosen, ROT] = x[accepted], y[accepted], rot[accepted]
+                rects[:, chosen] = np.stack((x, y, w, h))[:, accepted]
+                placed[chosen] = True
+                pending = pending[~accepted]
+
+            if self.metrics is not None:
+                self.metrics.count('valid_checks', checks)
+            return child
+
     def mutate(self, individual):
-            """Aplica mutação a um indivíduo"""
+            """Aplica mutação a um indivíduo (altera os genes no próprio array)"""
+            rects = self.genome.rects(individual)
+            index = None
+            checks = rejected = 0
             for i in range(len(individual)):
-                if random.random() < self.mutation_rate:
-                    table = individual[i]
+                if self.rng.random() < self.mutation_rate:
+                    w, h = int(rects[i, 2]), int(rects[i, 3])
+                    if index is None:
+                        index = self.layout.new_table_index()
+                        for j, (tx, ty, tw, th) in enumerate(rects.tolist()):
+                            index.insert(j, tx, ty, tw, th)
                     
-                    if random.random() < 0.7:  # 70% de chance de mutação de posição
+                    rot = int(individual[i, ROT])
+                    if self.rng.random() < 0.7:  # 70% de chance de mutação de posição
                         for _ in range(10):
-                            new_x = random.randint(0, self.planta['largura'] - table['w'])
-                            new_y = random.randint(0, self.planta['altura'] - table['h'])
-                            
-                            new_table = {
-                                'id': table['id'],
-                                'tipo': table['tipo'],
-                                'w': table['w'],
-                                'h': table['h'],
-                                'x': new_x,
-                                'y': new_y
-                            }
+                            position = self.layout.random_position(self.rng, w, h, rot)
+                            if position is None:
+                                break
+                            new_x, new_y = position
                             
-                            if self.layout.is_valid_position(new_table, [t for j, t in enumerate(individual) if j != i]):
-                                individual[i] = new_table
+                            checks += 1
+                            if not index.collides(new_x, new_y, w, h, ignore=i):
+                                individual[i, X] = new_x
+                                individual[i, Y] = new_y
+                                rects[i, 0], rects[i, 1] = new_x, new_y
+                                index.insert(i, new_x, new_y, w, h)
                                 break
+                            rejected += 1
                     else:  # 30% de chance de rotação
-                        if table['w'] != table['h']:
-                            new_table = {
-                                'id': table['id'],
-                                'tipo': table['tipo'],
-                                'w': table['h'],
-                                'h': table['w'],
-                                'x': table['x'],
-                                'y': table['y']
-                            }
-                            
-                            if self.layout.is_valid_position(new_table, [t for j, t in enumerate(individual) if j != i]):
-                                individual[i] = new_table
-            
+                        if w != h:
+                            x, y = int(individual[i, X]), int(individual[i, Y])
+                            checks += 1
+                            if self.layout.is_valid_rect(x, y, h, w, index, skip=i, rot=rot ^ 1):
+                                individual[i, ROT] ^= 1
+                                rects[i, 2], rects[i, 3] = h, w
+                                index.insert(i, x, y, h, w)
+                            else:
+                                rejected += 1
+
+            if self.metrics is not None:
+                self.metrics.count('valid_checks', checks)
+                self.metrics.count('rejected_mutations', rejected)
             return individual
 
+    def set_best(self, individual, fitness):
+        """Guarda uma cópia do melhor indivíduo, também na forma de dicts usada pelo visualizador.
+
+        A cópia garante que mutações posteriores no buffer da população não alterem o melhor.
+        """
+        self.best_fitness = fitness
+        self.best_genes = individual.copy()
+        self.best_individual = self.genome.decode(self.best_genes)
+
+
+    def top_individuals(self, k):
+        """Retorna cópias dos k melhores indivíduos da população atual e seus fitness"""
+        fitness_scores = self.evaluate_population(self.population)
+        order = sorted(range(len(self.population)), key=lambda i: fitness_scores[i], reverse=True)[:k]
+        return [self.population[i].copy() for i in order], [fitness_scores[i] for i in order]
+
+    def receive_migrants(self, migrants):
+        """Substitui os piores indivíduos da população pelos migrantes recebidos"""
+        if not migrants:
+            return
+        fitness_scores = self.evaluate_population(self.population)
+        worst = sorted(range(len(self.population)), key=lambda i: fitness_scores[i])
+        for i, migrant in zip(worst, migrants):
+            self.population[i] = migrant
+
+    def _phase(self, name):
+        """Timer da fase quando a instrumentação está ativa; caso contrário, um context manager vazio"""
+        return self.metrics.phase(name) if self.metrics is not None else _NO_PHASE
 
     def next_generation(self):
             """Gera a próxima geração"""
-            fitness_scores = [self.fitness(ind) for ind in self.population]
+            generation_start = time.perf_counter()
+            with self._phase("fitness"):
+                fitness_scores = self.evaluate_population(self.population)
+
+            # Refinamento local dos melhores indivíduos, antes de atualizar o melhor e selecionar os pais
+            if self.local_search is not None and self.local_search.due(self.generation):
+                with self._phase("local_search"):
+                    moves = self.local_search.apply(self, fitness_scores)
+                if self.metrics is not None:
+                    self.metrics.count('local_search_moves', moves)
             
             # Atualiza o melhor indivíduo
             current_best = max(fitness_scores)
             if current_best > self.best_fitness:
-                self.best_fitness = current_best
-                self.best_individual = self.population[fitness_scores.index(current_best)]
+                self.set_best(self.population[fitness_scores.index(current_best)], current_best)
+                self.last_improvement = self.generation
             
             # Seleção
-            selected = self.selection(self.population, fitness_scores)
+            with self._phase("selection"):
+                parents = self.selection_indices(fitness_scores, len(self.population) - self.elitism)
             
-            # Crossover e mutação
-            new_population = []
-            for i in range(0, len(selected), 2):
-                if i+1 < len(selected):
-                    parent1, parent2 = selected[i], selected[i+1]
-                    child1, child2 = self.crossover(parent1, parent2)
-                    new_population.extend([self.mutate(child1), self.mutate(child2)])
-                else:
-                    new_population.append(self.mutate(selected[i]))
+            # Elitismo: os k melhores passam direto para o início do próximo buffer
+            new_population = self.buffers.next
+            elite = self.elitism
+            if elite:
+                order = sorted(range(len(self.population)), key=lambda i: fitness_scores[i], reverse=True)
+                new_population[:elite] = self.population[order[:elite]]
+
+            # Crossover de todos os pares de uma vez e mutação, escritos no buffer da próxima geração
+            children = new_population[elite:]
+            with self._phase("crossover"):
+                crossover_population(self.np_rng, self.crossover_method, self.population, parents, children,
+                                     bounds=(self.planta['largura'], self.planta['altura']),
+                                     resolve=self.resolve_conflicts)
+            with self._phase("mutation"):
+                for child in children:
+                    self.mutate(child)
             
-            self.population = new_population
+            self.population = self.buffers.swap()
             self.generation += 1
 
             # Verifica critérios de parada
@@ -251,24 +498,51 @@ class GeneticAlgorithm:
                 stop_reason = f"Finalizou com {self.stagnation_limit} gerações"
             
             self.fitness_history.append(current_best)
+            if self.history_limit and len(self.fitness_history) >= 2 * self.history_limit:
+                keep = max(self.history_limit, self.convergence.window if self.convergence is not None else 0)
+                self.history_offset += len(self.fitness_history) - keep
+                del self.fitness_history[:-keep]
+            if self.convergence is not None:
+                convergence_reason = self.convergence.update(self)
+                stop_reason = stop_reason or convergence_reason
+            record = None
+            if self.metrics is not None:
+                record = self.metrics.end_generation(self.generation, best_fitness=current_best,
+                                                     mutation_rate=self.mutation_rate)
+            if self.telemetry is not None:
+                self._write_telemetry(fitness_scores, generation_start, record)
+            if self.checkpoint_every and self.checkpoint_path and self.generation % self.checkpoint_every == 0:
+                self.save_checkpoint()
                 
             return stop_reason
-    
-    def save_fitness_plot(self):
-        plt.figure(figsize=(10, 5))
-        plt.plot(self.fitness_history, label='Melhor Fitness')
-        plt.title(f'Evolução do Fitness - Método: {self.selection_method}')
-        plt.xlabel('Gerações')
-        plt.ylabel('Fitness')
-        plt.legend()
-        plt.grid(True)
 
-
-        filename = f"docs/fitness_plot_{self.selection_method}.png"
-
-        # Cria o diretório se não existir
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-
-        # Salva o gráfico
-        plt.savefig(filename)
-        plt.close()
\ No newline at end of file
+    def _write_telemetry(self, fitness_scores, generation_start, metrics_record=None):
+        """Envia para a telemetria o registro da geração que acabou de terminar"""
+        if self.convergence is not None:
+            diversity = self.convergence.diversity
+        elif self.generation % TELEMETRY_DIVERSITY_EVERY == 0:
+            diversity = population_diversity(self.population, self.planta)
+        else:
+            diversity = float('nan')
+        record = dict(metrics_record or {})
+        record.update({
+            'generation': self.generation,
+            'best_fitness': max(fitness_scores),
+            'mean_fitness': sum(fitness_scores) / len(fitness_scores),
+            'worst_fitness': min(fitness_scores),
+            'best_so_far': self.best_fitness,
+            'diversity': diversity,
+            'mutation_rate': self.mutation_rate,
+            'time_generation': time.perf_counter() - generation_start
+        })
+        self.telemetry.write(record)
+    
+    def save_fitness_plot(self, filename=None):
+        """Salva o gráfico de fitness; com telemetria, o histórico completo vem do arquivo"""
+        filename = filename or f"docs/fitness_plot_{self.selection_method}.png"
+        title = f'Evolução do Fitness - Método: {self.selection_method}'
+        if self.telemetry is not None:
+            self.telemetry.flush()
+            plot_fitness(self.telemetry.path, filename, title=title)
+        else:
+            plot_fitness(self.fitness_history, filename, title=title)
@@ -0,0 +1,91 @@
+import numpy as np
+
+from core.chairs import chair_count
+
+# Colunas do array de genes de cada indivíduo
+X, Y, ROT = 0, 1, 2
+GENE_DTYPE = np.int32
+
+
+class GenomeSpec:
+    """Dados estáticos das mesas (id, tipo, largura e altura base, cadeiras), guardados uma vez por execução.
+
+    Cada indivíduo é apenas um array contíguo (mesas, 3) de GENE_DTYPE com as colunas
+    x, y e o bit de rotação; as dimensões efetivas são derivadas de base_w/base_h.
+    """
+
+    def __init__(self, movable_tables):
+        self.ids = [table['id'] for table in movable_tables]
+        self.tipos = [table['tipo'] for table in movable_tables]
+        self.base_w = np.array([table['w'] for table in movable_tables], dtype=GENE_DTYPE)
+        self.base_h = np.array([table['h'] for table in movable_tables], dtype=GENE_DTYPE)
+        self.chairs = np.array([chair_count(table) for table in movable_tables], dtype=GENE_DTYPE)
+        self.rotatable = self.base_w != self.base_h
+        self._index = {table_id: i for i, table_id in enumerate(self.ids)}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def empty(self):
+        """Cria um array de genes zerado"""
+        return np.zeros((len(self), 3), dtype=GENE_DTYPE)
+
+    def table_dims(self, i, rot):
+        """Retorna (w, h) da mesa i com a rotação informada"""
+        if rot:
+            return int(self.base_h[i]), int(self.base_w[i])
+        return int(self.base_w[i]), int(self.base_h[i])
+
+    def dims(self, genes, tables=None):
+        """Retorna os arrays (w, h) efetivos para genes de formato (..., mesas, 3)
+
+        Com `tables`, os genes são só os dessas mesas, na mesma ordem.
+        """
+        rot = genes[..., ROT].astype(bool)
+        base_w = self.base_w if tables is None else self.base_w[tables]
+        base_h = self.base_h if tables is None else self.base_h[tables]
+        return np.where(rot, base_h, base_w), np.where(rot, base_w, base_h)
+
+    def rects(self, genes):
+        """Retorna um array (mesas, 4) com x, y, w, h de um indivíduo"""
+        w, h = self.dims(genes)
+        return np.stack((genes[:, X], genes[:, Y], w, h), axis=-1)
+
+    def pack(self, population):
+        """Empacota uma população de genes em um array (pop, mesas, 6) para o avaliador de fitness"""
+        genes = np.asarray(population, dtype=GENE_DTYPE).reshape(-1, len(self), 3)
+        w, h = self.dims(genes)
+        chairs = np.broadcast_to(self.chairs, w.shape)
+        return np.stack((genes[..., X], genes[..., Y], w, h, genes[..., ROT], chairs), axis=-1).astype(np.float64)
+
+    def decode(self, genes):
+        """Converte os genes na forma de lista de dicts usada pelo visualizador"""
+        w, h = self.dims(genes)
+        return [
+            {
+                'id': self.ids[i],
+                'tipo': self.tipos[i],
+                'w': int(w[i]),
+                'h': int(h[i]),
+                'x': int(genes[i, X]),
+                'y': int(genes[i, Y]),
+                'rot': int(genes[i, ROT]),
+                'cadeiras': int(self.chairs[i])
+            }
+            for i in range(len(self))
+        ]
+
+    def encode(self, tables):
+        """Converte uma lista de dicts (mesas com x, y, w, h) em genes; mesas ausentes ficam em (-10, -10)"""
+        genes = self.empty()
+        genes[:, X] = -10
+        genes[:, Y] = -10
+        for table in tables:
+            i = self._index.get(table['id'])
+            if i is None:
+                continue
+            genes[i, X] = round(table.get('x', -10))
+            genes[i, Y] = round(table.get('y', -10))
+            genes[i, ROT] = int(bool(self.rotatable[i]) and table['w'] == self.base_h[i]
+                                and table['h'] == self.base_w[i])
+        return genes
@@ -0,0 +1,91 @@
+import csv
+import json
+import time
+from collections import defaultdict
+
+# Contadores registrados pelo GeneticAlgorithm
+COUNTERS = (
+    'fitness_requests',       # indivíduos passados para evaluate_population
+    'fitness_evaluations',    # indivíduos realmente avaliados (fora do cache)
+    'valid_checks',           # posições candidatas checadas (mapa de viabilidade e colisão com outras mesas)
+    'rejected_mutations',     # tentativas de mutação rejeitadas pela checagem de posição
+    'fallback_placements',    # mesas estacionadas em (-10, -10) por create_individual
+    'local_search_moves',     # movimentos testados pela busca local (avaliados de forma incremental)
+)
+
+
+class _PhaseTimer:
+    def __init__(self, instrumentation, name):
+        self.instrumentation = instrumentation
+        self.key = f"time_{name}"
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.instrumentation.current[self.key] += time.perf_counter() - self.start
+
+
+class Instrumentation:
+    """Métricas opcionais do algoritmo genético: tempos por fase, contadores e callbacks por geração.
+
+    Quando o GeneticAlgorithm é criado sem instrumentação, nenhum destes métodos é chamado.
+    """
+
+    def __init__(self):
+        self.records = []
+        self.totals = defaultdict(float)
+        self.current = defaultdict(float)
+        self.callbacks = []
+        self._timers = {}
+        self._generation_start = time.perf_counter()
+
+    def phase(self, name):
+        """Context manager que acumula o tempo da fase `name` na geração atual"""
+        timer = self._timers.get(name)
+        if timer is None:
+            timer = self._timers[name] = _PhaseTimer(self, name)
+        return timer
+
+    def count(self, name, value=1):
+        """Incrementa um contador da geração atual"""
+        self.current[name] += value
+
+    def on_generation(self, callback):
+        """Registra callback(record) chamado ao final de cada geração"""
+        self.callbacks.append(callback)
+        return callback
+
+    def end_generation(self, generation, **values):
+        """Fecha o registro da geração, acumula os totais e chama os callbacks"""
+        now = time.perf_counter()
+        record = {'generation': generation, 'time_total': now - self._generation_start}
+        record.update(self.current)
+        for name in COUNTERS:
+            record[name] = int(self.current.get(name, 0))
+        record.update(values)
+        for key, value in self.current.items():
+            self.totals[key] += value
+        self.records.append(record)
+        self.current = defaultdict(float)
+        self._generation_start = now
+        for callback in self.callbacks:
+            callback(record)
+        return record
+
+    def to_json(self, path):
+        """Exporta os registros por geração e os totais em JSON"""
+        with open(path, 'w') as f:
+            json.dump({'records': self.records, 'totals': dict(self.totals)}, f, indent=2)
+
+    def to_csv(self, path):
+        """Exporta os registros por geração em CSV (uma linha por geração)"""
+        fields = []
+        for record in self.records:
+            fields.extend(key for key in record if key not in fields)
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(self.records)
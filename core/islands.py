@@ -0,0 +1,187 @@
+"""Modelo de ilhas: várias populações independentes, cada uma em um processo, com migração periódica.
+
+Uso:
+    python -m core.islands --config config/config.json --islands 4 --interval 10 --out result.json
+"""
+import argparse
+import multiprocessing
+import time
+
+from core.config import build_genetic, get_params, load_config
+from core.run import save_result
+
+# Topologias de migração suportadas
+TOPOLOGIES = ("ring", "full")
+SELECTION_METHODS = ("tournament", "rank", "roulette")
+
+
+def _island_worker(conn, config, params):
+    """Loop de um processo-ilha: recebe migrantes, roda algumas gerações e devolve seus melhores"""
+    genetic = build_genetic(config, **params)
+    genetic.last_improvement = 0
+    try:
+        while True:
+            command, payload = conn.recv()
+            if command == "stop":
+                break
+
+            genetic.receive_migrants(payload['migrants'])
+            history_start = genetic.generation
+            stop_reason = None
+            for _ in range(payload['generations']):
+                stop_reason = genetic.next_generation()
+                if stop_reason:
+                    break
+
+            top, top_fitness = genetic.top_individuals(payload['migration_size'])
+            conn.send({
+                'top': top,
+                'top_fitness': top_fitness,
+                'best_fitness': genetic.best_fitness,
+                'best_layout': genetic.best_individual,
+                'history': genetic.history_since(history_start),
+                'generation': genetic.generation,
+                'stop_reason': stop_reason
+            })
+    finally:
+        genetic.close()
+        conn.close()
+
+
+def default_islands(count, seed=None, **params):
+    """Cria a configuração de `count` ilhas alternando os métodos de seleção"""
+    islands = []
+    for i in range(count):
+        island = dict(params)
+        island['selection_method'] = SELECTION_METHODS[i % len(SELECTION_METHODS)]
+        island['seed'] = None if seed is None else seed + i
+        islands.append(island)
+    return islands
+
+
+class IslandModel:
+    """Orquestra N instâncias de GeneticAlgorithm em processos separados.
+
+    A cada `migration_interval` gerações, os `migration_size` melhores indivíduos de cada
+    ilha migram para as vizinhas (topologia "ring") ou para todas as outras ("full"),
+    substituindo os piores indivíduos do destino.
+    """
+
+    def __init__(self, config, islands, migration_interval=10, migration_size=2, topology="ring"):
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Topologia de migração desconhecida: {topology}")
+        for params in islands:
+            # Cada relatório leva o histórico da época inteira, que precisa caber no que fica em memória
+            history_limit = get_params(config, **params).get('history_limit')
+            if history_limit and history_limit < migration_interval:
+                raise ValueError(f"history_limit ({history_limit}) menor que o intervalo de migração "
+                                 f"({migration_interval})")
+        self.config = config
+        self.islands = islands
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.topology = topology
+
+    def _migrants_for(self, i, reports):
+        """Escolhe os migrantes que chegam na ilha i a partir dos últimos relatórios"""
+        if len(reports) < 2:
+            return []
+        if self.topology == "ring":
+            source = reports[(i - 1) % len(reports)]
+            return source['top'][:self.migration_size]
+
+        candidates = []
+        for j, report in enumerate(reports):
+            if j != i:
+                candidates.extend(zip(report['top_fitness'], report['top']))
+        candidates.sort(key=lambda item: item[0], reverse=True)
+        return [genes for _, genes in candidates[:self.migration_size]]
+
+    def run(self):
+        """Executa todas as ilhas até que todas atinjam um critério de parada"""
+        start = time.perf_counter()
+        context = multiprocessing.get_context()
+        connections, processes = [], []
+        for params in self.islands:
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(target=_island_worker, args=(child_conn, self.config, params))
+            process.start()
+            child_conn.close()
+            connections.append(parent_conn)
+            processes.append(process)
+
+        reports = [None] * len(self.islands)
+        histories = [[] for _ in self.islands]
+        stop_reasons = [None] * len(self.islands)
+        try:
+            while any(reason is None for reason in stop_reasons):
+                active = [i for i, reason in enumerate(stop_reasons) if reason is None]
+                known = [report for report in reports if report is not None]
+                for i in active:
+                    migrants = self._migrants_for(i, reports) if len(known) == len(reports) else []
+                    connections[i].send(("run", {
+                        'migrants': migrants,
+                        'generations': self.migration_interval,
+                        'migration_size': self.migration_size
+                    }))
+                for i in active:
+                    reports[i] = connections[i].recv()
+                    histories[i].extend(reports[i]['history'])
+                    stop_reasons[i] = reports[i]['stop_reason']
+        finally:
+            for conn in connections:
+                try:
+                    conn.send(("stop", None))
+                except (BrokenPipeError, OSError):
+                    pass
+            for process in processes:
+                process.join()
+
+        best = max(range(len(reports)), key=lambda i: reports[i]['best_fitness'])
+        longest = max(len(history) for history in histories)
+        combined = [max(history[g] for history in histories if g < len(history)) for g in range(longest)]
+        return {
+            'islands': [
+                {**params, 'best_fitness': report['best_fitness'], 'generations': report['generation'],
+                 'stop_reason': reason, 'fitness_history': history}
+                for params, report, reason, history in zip(self.islands, reports, stop_reasons, histories)
+            ],
+            'topology': self.topology,
+            'best_island': best,
+            'best_fitness': reports[best]['best_fitness'],
+            'best_layout': reports[best]['best_layout'],
+            'fitness_history': combined,
+            'elapsed_seconds': time.perf_counter() - start
+        }
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Algoritmo genético com modelo de ilhas em vários processos")
+    parser.add_argument('--config', default='config/config.json', help="Arquivo JSON da planta")
+    parser.add_argument('--islands', type=int, default=multiprocessing.cpu_count(), help="Número de ilhas")
+    parser.add_argument('--interval', type=int, default=10, help="Gerações entre migrações")
+    parser.add_argument('--migrants', type=int, default=2, help="Indivíduos enviados por migração")
+    parser.add_argument('--topology', choices=TOPOLOGIES, default="ring")
+    parser.add_argument('--seed', type=int, default=None, help="Semente base (cada ilha usa seed + i)")
+    parser.add_argument('--mutation-rate', type=float)
+    parser.add_argument('--population-size', type=int)
+    parser.add_argument('--out', default='result.json', help="Arquivo JSON de saída")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    islands = default_islands(args.islands, seed=args.seed, mutation_rate=args.mutation_rate,
+                              population_size=args.population_size)
+    model = IslandModel(load_config(args.config), islands, migration_interval=args.interval,
+                        migration_size=args.migrants, topology=args.topology)
+    result = model.run()
+    result['seed'] = args.seed
+    save_result(result, args.out)
+    print(f"melhor fitness {result['best_fitness']:.2f} (ilha {result['best_island']}) "
+          f"em {result['elapsed_seconds']:.2f}s -> {args.out}")
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,67 @@
+import copy
+import math
+from collections import defaultdict
+
+import numpy as np
+
+from core.chairs import CHAIR_SPACE, chair_clearance
+
+
+class TableIndex:
+    """Índice incremental de mesas posicionadas em uma grade uniforme de buckets.
+
+    Cada mesa é registrada em todas as células que cobre; uma consulta de colisão só
+    examina as mesas das células vizinhas ao retângulo, com custo O(1) em média.
+    """
+
+    def __init__(self, spacing, cell_size):
+        self.spacing = spacing
+        self.cell_size = max(cell_size, 1)
+        self.cells = defaultdict(set)
+        self.rects = {}
+
+    def __len__(self):
+        return len(self.rects)
+
+    def _cells(self, x0, y0, x1, y1):
+        c = self.cell_size
+        for cx in range(math.floor(x0 / c), math.floor(x1 / c) + 1):
+            for cy in range(math.floor(y0 / c), math.floor(y1 / c) + 1):
+                yield cx, cy
+
+    def insert(self, key, x, y, w, h):
+        """Registra (ou reposiciona) a mesa identificada por key"""
+        if key in self.rects:
+            self.remove(key)
+        self.rects[key] = (x, y, w, h)
+        for cell in self._cells(x, y, x + w, y + h):
+            self.cells[cell].add(key)
+
+    def remove(self, key):
+        """Remove a mesa identificada por key do índice"""
+        x, y, w, h = self.rects.pop(key)
+        for cell in self._cells(x, y, x + w, y + h):
+            bucket = self.cells[cell]
+            bucket.discard(key)
+            if not bucket:
+                del self.cells[cell]
+
+    def collides(self, x, y, w, h, ignore=None):
+        """Verifica se o retângulo colide (considerando o espaçamento) com alguma mesa indexada"""
+        s = self.spacing
+        checked = set()
+        for cell in self._cells(x - s, y - s, x + w + s, y + h + s):
+            for key in self.cells.get(cell, ()):
+                if key == ignore or key in checked:
+                    continue
+                checked.add(key)
+                ox, oy, ow, oh = self.rects[key]
+                if not (x + w + s <= ox or ox + ow + s <= x or
+                        y + h + s <= oy or oy + oh + s <= y):
+                    return True
+        return False
+
+
 class Layout:
     def __init__(self, planta, fixed_elements, movable_tables, spacing):
         self.planta = planta
@@ -5,6 +69,23 @@ class Layout:
         self.movable_tables = movable_tables
         self.spacing = spacing
         self.restricted_areas = self.calculate_restricted_areas()
+        self.restricted_grid = self.build_restricted_grid()
+        # Tabela de somas acumuladas (integral image) para consultar qualquer janela em O(1)
+        self._restricted_sat = np.zeros((self.planta['altura'] + 1, self.planta['largura'] + 1), dtype=np.int32)
+        self._restricted_sat[1:, 1:] = self.restricted_grid.cumsum(axis=0).cumsum(axis=1)
+        self._position_masks = {}
+        self._feasible = {}
+
+    def with_tables(self, planta, movable_tables):
+        """Cópia leve para outra planta com a mesma geometria (dimensões, elementos fixos e espaçamento).
+
+        A grade de áreas restritas, a integral image e as máscaras de posição já calculadas
+        são compartilhadas; só a planta e as mesas móveis mudam.
+        """
+        layout = copy.copy(self)
+        layout.planta = planta
+        layout.movable_tables = movable_tables
+        return layout
 
     def calculate_restricted_areas(self):
             """Calcula áreas restritas (paredes, banheiro, etc.)"""
@@ -20,29 +101,172 @@ class Layout:
                     })
             return restricted
         
+    def build_restricted_grid(self):
+            """Rasteriza as áreas restritas (já com o buffer) na resolução da planta; índice [y, x]"""
+            grid = np.zeros((self.planta['altura'], self.planta['largura']), dtype=bool)
+            for area in self.restricted_areas:
+                x0, y0 = max(math.floor(area['x']), 0), max(math.floor(area['y']), 0)
+                x1 = min(math.ceil(area['x'] + area['w']), self.planta['largura'])
+                y1 = min(math.ceil(area['y'] + area['h']), self.planta['altura'])
+                if x0 < x1 and y0 < y1:
+                    grid[y0:y1, x0:x1] = True
+            return grid
+
+    def new_table_index(self):
+        """Cria um índice espacial vazio dimensionado para as mesas desta planta"""
+        largest = max((max(t['w'], t['h']) for t in self.movable_tables), default=1)
+        return TableIndex(self.spacing, largest + self.spacing)
+
+    def position_mask(self, w, h, rot=0):
+            """Mapa de viabilidade [y, x] dos cantos superiores esquerdos válidos para uma mesa w x h.
+
+            Considera limites, áreas restritas e o espaço das cadeiras na orientação `rot`
+            (não as outras mesas); é calculado uma vez por dimensão e orientação e
+            reutilizado. Não altere o array retornado.
+            """
+            key = (w, h, int(rot))
+            mask = self._position_masks.get(key)
+            if mask is None:
+                rows, cols = self.planta['altura'] - h + 1, self.planta['largura'] - w + 1
+                if rows <= 0 or cols <= 0:
+                    mask = np.zeros((max(rows, 0), max(cols, 0)), dtype=bool)
+                else:
+                    sat = self._restricted_sat
+                    mask = (sat[h:, w:] - sat[:-h, w:] - sat[h:, :-w] + sat[:-h, :-w]) == 0
+                    ys, xs = np.ogrid[:rows, :cols]
+                    mask &= chair_clearance(xs, ys, w, h, rot, self.planta['largura'], self.planta['altura'])
+                    # Faixas das cadeiras contra o raster: com coordenadas inteiras, a faixa de
+                    # profundidade CHAIR_SPACE toca as ceil(CHAIR_SPACE) células ao lado da mesa
+                    c = math.ceil(CHAIR_SPACE)
+                    if rot:
+                        strips = ((xs - c, ys, xs, ys + h), (xs + w, ys, xs + w + c, ys + h))
+                    else:
+                        strips = ((xs, ys - c, xs + w, ys), (xs, ys + h, xs + w, ys + h + c))
+                    for x0, y0, x1, y1 in strips:
+                        mask &= self._window_free(x0, y0, x1, y1)
+                self._position_masks[key] = mask
+            return mask
+
+    def _window_free(self, x0, y0, x1, y1):
+        """Janelas [y0, y1) x [x0, x1) do raster sem áreas restritas (recortadas à planta; aceita arrays)"""
+        largura, altura = self.planta['largura'], self.planta['altura']
+        x0, x1 = np.clip(x0, 0, largura), np.clip(x1, 0, largura)
+        y0, y1 = np.clip(y0, 0, altura), np.clip(y1, 0, altura)
+        sat = self._restricted_sat
+        return (sat[y1, x1] - sat[y0, x1] - sat[y1, x0] + sat[y0, x0]) == 0
+
+    def feasible_positions(self, w, h, rot=0):
+        """Índices planos (y * colunas + x) das posições válidas do mapa de viabilidade, em cache"""
+        key = (w, h, int(rot))
+        positions = self._feasible.get(key)
+        if positions is None:
+            positions = self._feasible[key] = np.flatnonzero(self.position_mask(w, h, rot))
+        return positions
+
+    def random_position(self, rng, w, h, rot=0):
+        """Sorteia (x, y) direto do mapa de viabilidade, sem tentativas rejeitadas; None se não houver posição"""
+        positions = self.feasible_positions(w, h, rot)
+        if not len(positions):
+            return None
+        y, x = divmod(int(positions[rng.randrange(len(positions))]), self.planta['largura'] - w + 1)
+        return x, y
+
+    def _dims_groups(self, w, h, rot):
+        """Agrupa arrays de dimensões e rotação: gera (índices, w, h, rot) por combinação distinta"""
+        keys = (np.asarray(w, dtype=np.int64) * (int(np.max(h, initial=0)) + 1) + h) * 2 + rot
+        for key in np.unique(keys).tolist():
+            selected = np.flatnonzero(keys == key)
+            first = selected[0]
+            yield selected, int(w[first]), int(h[first]), int(rot[first])
+
+    def random_positions(self, rng, w, h, rot):
+        """Versão vetorizada de random_position; retorna (x, y, ok), com ok False onde não há posição"""
+        x = np.zeros(len(w), dtype=np.int64)
+        y = np.zeros(len(w), dtype=np.int64)
+        ok = np.zeros(len(w), dtype=bool)
+        for selected, kw, kh, krot in self._dims_groups(w, h, rot):
+            positions = self.feasible_positions(kw, kh, krot)
+            if not len(positions):
+                continue
+            draws = positions[[rng.randrange(len(positions)) for _ in range(len(selected))]]
+            y[selected], x[selected] = np.divmod(draws, self.planta['largura'] - kw + 1)
+            ok[selected] = True
+        return x, y, ok
+
+    def valid_positions(self, x, y, w, h, rot):
+        """Versão vetorizada da consulta ao mapa de viabilidade de is_valid_rect (arrays inteiros)"""
+        valid = np.zeros(len(x), dtype=bool)
+        for selected, kw, kh, krot in self._dims_groups(w, h, rot):
+            mask = self.position_mask(kw, kh, krot)
+            xs, ys = x[selected], y[selected]
+            inside = (0 <= xs) & (xs < mask.shape[1]) & (0 <= ys) & (ys < mask.shape[0])
+            valid[selected[inside]] = mask[ys[inside], xs[inside]]
+        return valid
+
+    def hits_restricted(self, x, y, w, h):
+        """Verifica colisão de um retângulo (dentro da planta) com as áreas restritas"""
+        if x == int(x) and y == int(y) and w == int(w) and h == int(h):
+            x0, y0, x1, y1 = int(x), int(y), int(x + w), int(y + h)
+            sat = self._restricted_sat
+            return bool(sat[y1, x1] - sat[y0, x1] - sat[y1, x0] + sat[y0, x0])
+        table = {'x': x, 'y': y, 'w': w, 'h': h}
+        return any(self.check_collision(table, area) for area in self.restricted_areas)
+
+    def in_bounds(self, x, y, w, h, rot=0):
+        """Verifica limites da planta com espaço para cadeiras (fora das áreas restritas)"""
+        return (0 <= x and x + w <= self.planta['largura'] and
+                0 <= y and y + h <= self.planta['altura'] and
+                bool(chair_clearance(x, y, w, h, rot, self.planta['largura'], self.planta['altura'],
+                                     areas=self.restricted_areas)))
+
     def is_valid_position(self, table, other_tables, allow_overlap=False):
-        """Verifica se a posição da mesa é válida"""
-        # Verifica colisão com elementos fixos (sempre deve ser evitada)
-        for area in self.restricted_areas:
-            if self.check_collision(table, area):
-                return False
-
-        # Verifica colisão com outras mesas, a menos que sobreposição esteja permitida
-        if not allow_overlap:
-            for other in other_tables:
-                if self.check_collision(table, other, spacing=self.spacing):
+        """Verifica se a posição da mesa é válida; other_tables pode ser uma lista ou um TableIndex"""
+        if allow_overlap:
+            other_tables = None
+        return self.is_valid_rect(table['x'], table['y'], table['w'], table['h'], other_tables,
+                                  rot=table.get('rot', 0))
+
+    def is_valid_rect(self, x, y, w, h, others=None, skip=None, rot=0):
+            """Versão sem dicts de is_valid_position.
+
+            others pode ser um TableIndex (consulta O(1) em média), um array (m, 4) com
+            x, y, w, h ou uma lista de dicts; skip ignora a mesa de mesma chave/índice.
+            """
+            if x == int(x) and y == int(y) and w == int(w) and h == int(h):
+                # Coordenadas inteiras: limites, cadeiras e áreas restritas em uma consulta ao mapa
+                mask = self.position_mask(int(w), int(h), rot)
+                if not (0 <= y < mask.shape[0] and 0 <= x < mask.shape[1] and mask[int(y), int(x)]):
+                    return False
+            else:
+                # Limites da planta primeiro: garante que a janela do raster está dentro da planta
+                if not self.in_bounds(x, y, w, h, rot):
                     return False
 
-        # Verifica limites da planta com espaço para cadeiras
-        chair_space = 1.5
-        if (table['x'] < 0 or 
-            table['y'] < chair_space or 
-            table['x'] + table['w'] > self.planta['largura'] or
-            table['y'] + table['h'] > self.planta['altura'] - chair_space):
-            return False
+                # Colisão com elementos fixos (sempre deve ser evitada)
+                if self.hits_restricted(x, y, w, h):
+                    return False
+
+            if others is None:
+                return True
+            if isinstance(others, TableIndex):
+                return not others.collides(x, y, w, h, ignore=skip)
+            if isinstance(others, np.ndarray):
+                if not len(others):
+                    return True
+                ox, oy, ow, oh = others[:, 0], others[:, 1], others[:, 2], others[:, 3]
+                s = self.spacing
+                hits = ~((x + w + s <= ox) | (ox + ow + s <= x) |
+                         (y + h + s <= oy) | (oy + oh + s <= y))
+                if skip is not None:
+                    hits[skip] = False
+                return not hits.any()
+
+            table = {'x': x, 'y': y, 'w': w, 'h': h}
+            for j, other in enumerate(others):
+                if j != skip and self.check_collision(table, other, spacing=self.spacing):
+                    return False
+            return True
 
-        return True
-        
     def check_collision(self, rect1, rect2, spacing=0):
             """Verifica colisão entre dois retângulos"""
             return not (rect1['x'] + rect1['w'] + spacing <= rect2['x'] or
@@ -54,4 +278,4 @@ class Layout:
             """Calcula distância entre duas mesas"""
             x1, y1 = table1['x'] + table1['w']/2, table1['y'] + table1['h']/2
             x2, y2 = table2['x'] + table2['w']/2, table2['y'] + table2['h']/2
-            return ((x1 - x2)**2 + (y1 - y2)**2)**0.5
\ No newline at end of file
+            return ((x1 - x2)**2 + (y1 - y2)**2)**0.5
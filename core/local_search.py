@@ -0,0 +1,126 @@
+import math
+import time
+
+import numpy as np
+
+# Estratégias de busca local suportadas
+LOCAL_SEARCH_METHODS = ("hill_climb", "annealing")
+
+
+class LocalSearch:
+    """Refinamento local (etapa memética) dos melhores indivíduos do GeneticAlgorithm.
+
+    A cada `every` gerações, os `top_k` melhores indivíduos passam por até `steps`
+    movimentos pequenos (deslocar uma mesa alguns pontos, trocar duas mesas de lugar
+    ou rotacionar uma mesa), avaliados com o IncrementalFitness em O(n) por movimento.
+    Com "hill_climb" só melhorias são aceitas; com "annealing" pioras são aceitas com
+    probabilidade exp(delta / T), com T caindo de `temperature` por `cooling` a cada passo.
+    `time_budget` (segundos) limita o tempo de cada etapa. Como o IncrementalFitness considera
+    todos os pares de mesas, o GeneticAlgorithm não aceita busca local com `distance_neighbors`.
+    """
+
+    def __init__(self, method="hill_climb", every=10, top_k=2, steps=200, time_budget=None,
+                 max_nudge=3, temperature=1.0, cooling=0.99):
+        if method not in LOCAL_SEARCH_METHODS:
+            raise ValueError(f"Busca local desconhecida: {method}")
+        self.method = method
+        self.every = every
+        self.top_k = top_k
+        self.steps = steps
+        self.time_budget = time_budget
+        self.max_nudge = max_nudge
+        self.temperature = temperature
+        self.cooling = cooling
+
+        self.moves_tried = 0
+        self.moves_accepted = 0
+
+    def due(self, generation):
+        """Indica se a busca local roda nesta geração"""
+        return self.every > 0 and generation % self.every == 0
+
+    def _propose(self, genetic, state):
+        """Aplica um movimento aleatório ao estado; retorna a lista [(mesa, x, y, rot)] para desfazê-lo"""
+        rng, genes = genetic.rng, state.genes
+        n = len(genes)
+        if not n:
+            return []
+        move = rng.random()
+        if move < 0.2 and n > 1:
+            # Troca duas mesas de lugar (cada uma mantém a própria rotação)
+            a, b = rng.sample(range(n), 2)
+            old = [(a, *genes[a].tolist()), (b, *genes[b].tolist())]
+            state.move(a, int(old[1][1]), int(old[1][2]))
+            state.move(b, int(old[0][1]), int(old[0][2]))
+            return old
+
+        k = rng.randrange(n)
+        old = [(k, *genes[k].tolist())]
+        x, y, rot = old[0][1:]
+        if move < 0.35 and genetic.genome.rotatable[k]:
+            state.move(k, x, y, rot ^ 1)
+        elif not state.in_bounds[k]:
+            # Mesa estacionada fora da planta: um deslocamento pequeno não resolve, sorteia do mapa
+            w, h = genetic.genome.table_dims(k, rot)
+            position = genetic.layout.random_position(rng, w, h, rot)
+            if position is not None:
+                state.move(k, *position)
+        else:
+            d = self.max_nudge
+            dx, dy = rng.randint(-d, d), rng.randint(-d, d)
+            state.move(k, x + dx, y + dy)
+        return old
+
+    def refine(self, genetic, genes, deadline=None):
+        """Refina uma cópia dos genes; retorna (melhores genes, score incremental, movimentos testados)"""
+        state = genetic.incremental(genes)
+        current = best = state.score()
+        best_genes = state.genes.copy()
+        if not math.isfinite(current):
+            # Com uma mesa só a distância mínima é infinita e os deltas seriam inf - inf
+            return best_genes, best, 0
+        temperature = self.temperature
+        tried = 0
+        for _ in range(self.steps):
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+            undo = self._propose(genetic, state)
+            tried += 1
+            score = state.score()
+            delta = score - current
+            if delta > 0 or (self.method == "annealing" and temperature > 0 and
+                             genetic.rng.random() < math.exp(delta / temperature)):
+                current = score
+                self.moves_accepted += 1
+                if score > best:
+                    best = score
+                    best_genes[:] = state.genes
+            else:
+                for k, x, y, rot in reversed(undo):
+                    state.move(k, x, y, rot)
+            temperature *= self.cooling
+        self.moves_tried += tried
+        return best_genes, best, tried
+
+    def apply(self, genetic, fitness_scores):
+        """Refina os top_k indivíduos da população atual no próprio buffer e atualiza fitness_scores.
+
+        Os indivíduos melhorados são reavaliados pelo avaliador do algoritmo, então os scores
+        continuam iguais aos de evaluate_population. Retorna o número de movimentos testados.
+        """
+        deadline = None if self.time_budget is None else time.perf_counter() + self.time_budget
+        order = np.argsort(fitness_scores, kind='stable')[::-1][:self.top_k]
+        candidates, tried = {}, 0
+        for i in order.tolist():
+            genes, score, count = self.refine(genetic, genetic.population[i], deadline)
+            tried += count
+            if score > fitness_scores[i] and not np.array_equal(genes, genetic.population[i]):
+                candidates[i] = genes
+        if candidates:
+            # O score incremental pode diferir no último dígito; só entra o que melhora de fato
+            values = genetic.evaluate_population(list(candidates.values()))
+            for (i, genes), value in zip(candidates.items(), values):
+                if value > fitness_scores[i]:
+                    genetic.population[i] = genes
+                    fitness_scores[i] = value
+        return tried
@@ -0,0 +1,107 @@
+import numpy as np
+
+# Métodos de seleção e de crossover suportados
+SELECTION_METHODS = ("tournament", "roulette", "rank")
+CROSSOVER_METHODS = ("one_point", "two_point", "uniform", "geometric")
+
+
+def select_tournament(rng, fitness, count, k=5):
+    """Índices dos vencedores de `count` torneios de k candidatos (sorteados com reposição)"""
+    candidates = rng.integers(0, len(fitness), size=(count, k))
+    winners = np.argmax(fitness[candidates], axis=1)
+    return candidates[np.arange(count), winners]
+
+
+def select_roulette(rng, fitness, count):
+    """Índices sorteados com probabilidade proporcional ao fitness"""
+    total = fitness.sum()
+    if total <= 0:
+        return rng.integers(0, len(fitness), size=count)
+    return rng.choice(len(fitness), size=count, p=fitness / total)
+
+
+def select_rank(rng, fitness, count):
+    """Índices sorteados com probabilidade proporcional ao rank (1 = pior, n = melhor)"""
+    n = len(fitness)
+    order = np.argsort(fitness, kind='stable')
+    ranks = np.arange(1, n + 1, dtype=np.float64)
+    return order[rng.choice(n, size=count, p=ranks / ranks.sum())]
+
+
+def select_indices(rng, method, fitness_scores, count):
+    """Índices dos pais de uma geração inteira, em uma única chamada"""
+    fitness = np.asarray(fitness_scores, dtype=np.float64)
+    if method == "tournament":
+        return select_tournament(rng, fitness, count)
+    elif method == "roulette":
+        return select_roulette(rng, fitness, count)
+    elif method == "rank":
+        return select_rank(rng, fitness, count)
+    raise ValueError(f"Método de seleção desconhecido: {method}")
+
+
+def crossover_mask(rng, method, pairs, n_tables):
+    """Matriz (pares, mesas): True onde o primeiro filho herda do primeiro pai"""
+    if n_tables < 2:
+        return np.ones((pairs, n_tables), dtype=bool)
+    genes = np.arange(n_tables)
+    if method == "one_point":
+        points = rng.integers(1, n_tables, size=pairs)
+        return genes < points[:, None]
+    elif method == "two_point":
+        points = np.sort(rng.integers(1, n_tables, size=(pairs, 2)), axis=1)
+        return (genes < points[:, :1]) | (genes >= points[:, 1:])
+    elif method == "uniform":
+        return rng.random((pairs, n_tables)) < 0.5
+    raise ValueError(f"Método de crossover desconhecido: {method}")
+
+
+def geometric_sides(rng, first, second, bounds):
+    """Lado do corte de cada mesa nos dois pais do crossover geométrico.
+
+    Para cada par sorteia um eixo e uma linha de corte na planta e retorna duas matrizes
+    (pares, mesas): True onde a mesa está antes do corte no primeiro e no segundo pai.
+    """
+    pairs = len(first)
+    axis = rng.integers(0, 2, size=pairs)
+    cut = rng.random(pairs) * np.asarray(bounds, dtype=np.float64)[axis]
+    rows = np.arange(pairs)
+    return (first[rows, :, axis] < cut[:, None]), (second[rows, :, axis] < cut[:, None])
+
+
+def crossover_population(rng, method, population, parents, out, bounds=None, resolve=None):
+    """Gera todos os filhos de uma vez a partir dos índices dos pais.
+
+    Os pais são pareados em ordem (0 com 1, 2 com 3, ...) e os filhos escritos em `out`,
+    que deve ter o mesmo número de linhas que `parents`. Com número ímpar de pais, o
+    último é copiado sem crossover.
+
+    O crossover "geometric" precisa de `bounds` (largura, altura) da planta. O primeiro
+    filho herda do primeiro pai as mesas que nele estão antes do corte e do segundo pai as
+    que nele estão depois (o segundo filho, o contrário). Uma mesa que cai dos dois lados
+    ou de nenhum fica em conflito: o filho recebe uma das cópias e `resolve(filho,
+    alternativa, mesas)` escolhe entre ela e a cópia alternativa (ou reposiciona a mesa).
+    """
+    pairs = len(parents) // 2
+    first, second = population[parents[0:2 * pairs:2]], population[parents[1:2 * pairs:2]]
+    if method == "geometric":
+        if bounds is None:
+            raise ValueError("O crossover geométrico precisa das dimensões da planta")
+        side1, side2 = geometric_sides(rng, first, second, bounds)
+        children1, children2 = out[0:2 * pairs:2], out[1:2 * pairs:2]
+        np.copyto(children1, np.where(side1[:, :, None], first, second))
+        np.copyto(children2, np.where(side2[:, :, None], second, first))
+        if resolve is not None:
+            conflicts = side1 != side2
+            alternative = np.where(side1[:, :, None], second, first)
+            for p in np.flatnonzero(conflicts.any(axis=1)).tolist():
+                tables = np.flatnonzero(conflicts[p])
+                resolve(children1[p], alternative[p], tables)
+                resolve(children2[p], alternative[p], tables)
+    else:
+        mask = crossover_mask(rng, method, pairs, population.shape[1])[:, :, None]
+        np.copyto(out[0:2 * pairs:2], np.where(mask, first, second))
+        np.copyto(out[1:2 * pairs:2], np.where(mask, second, first))
+    if len(parents) % 2:
+        out[-1] = population[parents[-1]]
+    return out
@@ -0,0 +1,58 @@
+import math
+
+import numpy as np
+
+from core.genome import ROT, X, Y
+
+# Inicializadores disponíveis para a população
+INITIALIZERS = ("random", "bottom_left")
+
+
+def block_table(masks, x, y, w, h, spacing):
+    """Remove das máscaras de posições livres os cantos onde outra mesa colidiria com (x, y, w, h)"""
+    # Células em que outra mesa não pode entrar, considerando o espaçamento
+    x0, y0 = math.floor(x - spacing), math.floor(y - spacing)
+    x1, y1 = math.ceil(x + w + spacing), math.ceil(y + h + spacing)
+    for (mw, mh, _), mask in masks.items():
+        rows, cols = mask.shape
+        mask[max(y0 - mh + 1, 0):min(y1, rows), max(x0 - mw + 1, 0):min(x1, cols)] = False
+
+
+def bottom_left_individual(genetic):
+    """Cria um indivíduo com a heurística construtiva bottom-left sobre o bitmap de espaço livre.
+
+    As mesas são colocadas em ordem (e orientação preferida) aleatória, cada uma na posição
+    livre mais baixa e, entre essas, mais à esquerda. Os mapas de viabilidade do Layout
+    (limites, cadeiras e áreas restritas) são copiados por dimensão e orientação de mesa e
+    atualizados só na região de cada mesa colocada. Mesas que não cabem ficam em
+    (-10, -10), como em create_individual.
+    """
+    layout = genetic.layout
+    genome = genetic.genome
+    masks = {}
+    placed = []
+
+    genes = genome.empty()
+    order = list(range(len(genome)))
+    genetic.rng.shuffle(order)
+    for i in order:
+        rotations = [0, 1] if genome.rotatable[i] else [0]
+        genetic.rng.shuffle(rotations)
+        genes[i] = (-10, -10, 0)
+        for rot in rotations:
+            w, h = genome.table_dims(i, rot)
+            valid = masks.get((w, h, rot))
+            if valid is None:
+                valid = masks[(w, h, rot)] = layout.position_mask(w, h, rot).copy()
+                for rect in placed:
+                    block_table({(w, h, rot): valid}, *rect, layout.spacing)
+            rows = np.flatnonzero(valid.any(axis=1))
+            if not len(rows):
+                continue
+            y = int(rows[-1])
+            x = int(np.argmax(valid[y]))
+            genes[i, X], genes[i, Y], genes[i, ROT] = x, y, rot
+            placed.append((x, y, w, h))
+            block_table(masks, x, y, w, h, layout.spacing)
+            break
+    return genes
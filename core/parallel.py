@@ -0,0 +1,79 @@
+import os
+
+import numpy as np
+
+# Modos de avaliação suportados
+BACKENDS = ("serial", "thread", "process")
+
+# Avaliador do processo worker, criado uma única vez na inicialização do pool
+_worker_evaluator = None
+
+
+def _init_worker(evaluator):
+    """Recebe o estado da planta uma vez por processo, em vez de a cada tarefa"""
+    global _worker_evaluator
+    _worker_evaluator = evaluator
+
+
+def _evaluate_chunk(packed):
+    return _worker_evaluator.evaluate_packed(packed)
+
+
+class EvaluationBackend:
+    """Executa o avaliador de fitness em série, em um pool de threads ou em um pool de processos.
+
+    A população empacotada é dividida em blocos contíguos e os resultados são
+    concatenados na ordem original, então os scores não dependem do número de workers.
+    """
+
+    def __init__(self, evaluator, mode="serial", workers=None, chunk_size=None):
+        if mode not in BACKENDS:
+            raise ValueError(f"Backend de avaliação desconhecido: {mode}")
+        self.evaluator = evaluator
+        self.mode = mode
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._executor = None
+
+    def _get_executor(self):
+        if self._executor is None:
+            # Importado só aqui: no modo serial (e em cada worker de uma varredura) o pool nunca é usado
+            from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+            if self.mode == "thread":
+                self._executor = ThreadPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    initializer=_init_worker,
+                    initargs=(self.evaluator,)
+                )
+        return self._executor
+
+    def _chunks(self, packed):
+        size = self.chunk_size or -(-len(packed) // self.workers)
+        return [packed[start:start + size] for start in range(0, len(packed), max(size, 1))]
+
+    def evaluate(self, packed):
+        """Retorna a lista de fitness de uma população empacotada (pop, mesas, 4)"""
+        if self.mode == "serial" or len(packed) <= 1:
+            return self.evaluator.evaluate_packed(packed).tolist()
+
+        chunks = self._chunks(packed)
+        if self.mode == "thread":
+            results = self._get_executor().map(self.evaluator.evaluate_packed, chunks)
+        else:
+            results = self._get_executor().map(_evaluate_chunk, chunks)
+        return np.concatenate(list(results)).tolist()
+
+    def close(self):
+        """Encerra o pool de workers, se existir"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,59 @@
+"""Gráficos de evolução do fitness, gerados à parte a partir do arquivo de telemetria.
+
+Uso:
+    python -m core.plotting runs/telemetry.jsonl --out docs/fitness_plot.png --title "Método: rank"
+"""
+import argparse
+
+from core.telemetry import read_telemetry
+from core.utils import ensure_parent_dir
+
+
+def plot_fitness(history, out_file, title='Evolução do Fitness'):
+    """Salva o gráfico do melhor fitness por geração.
+
+    `history` pode ser uma lista de valores ou o caminho de um arquivo de telemetria; neste
+    caso também são plotados a média e o pior fitness da população.
+    """
+    # Importado só aqui para que execuções sem gráfico não carreguem o matplotlib
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(10, 5))
+    if isinstance(history, str):
+        records = read_telemetry(history)
+        generations = [record['generation'] for record in records]
+        plt.plot(generations, [record['best_fitness'] for record in records], label='Melhor Fitness')
+        if records and records[0].get('mean_fitness') is not None:
+            plt.plot(generations, [record['mean_fitness'] for record in records], label='Fitness Médio', alpha=0.7)
+            plt.plot(generations, [record['worst_fitness'] for record in records], label='Pior Fitness', alpha=0.4)
+    else:
+        plt.plot(history, label='Melhor Fitness')
+    plt.title(title)
+    plt.xlabel('Gerações')
+    plt.ylabel('Fitness')
+    plt.legend()
+    plt.grid(True)
+
+    ensure_parent_dir(out_file)
+
+    # Salva o gráfico
+    plt.savefig(out_file)
+    plt.close()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Gráfico de fitness a partir de um arquivo de telemetria")
+    parser.add_argument('telemetry', help="Arquivo .jsonl ou .csv gravado com --telemetry")
+    parser.add_argument('--out', default='docs/fitness_plot.png', help="Imagem de saída")
+    parser.add_argument('--title', default='Evolução do Fitness')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    plot_fitness(args.telemetry, args.out, title=args.title)
+    print(f"Gráfico salvo em {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import numpy as np
+
+
+class PopulationBuffer:
+    """Par de arrays (pop, mesas, 3) pré-alocados, reutilizados a cada geração.
+
+    A geração atual fica no buffer da frente e os filhos são escritos diretamente no
+    buffer de trás; `swap` troca os papéis sem alocar nada. Os pais nunca são
+    alterados enquanto os filhos são gerados, então não há aliasing entre gerações.
+    """
+
+    def __init__(self, size, n_tables, dtype):
+        self._buffers = (np.zeros((size, n_tables, 3), dtype=dtype),
+                         np.zeros((size, n_tables, 3), dtype=dtype))
+        self._front = 0
+
+    def __len__(self):
+        return len(self._buffers[0])
+
+    @property
+    def current(self):
+        """População da geração atual"""
+        return self._buffers[self._front]
+
+    @property
+    def next(self):
+        """Buffer onde a próxima geração é escrita"""
+        return self._buffers[1 - self._front]
+
+    def swap(self):
+        """Promove o buffer de trás a geração atual"""
+        self._front = 1 - self._front
+        return self.current
+
+    def load(self, individuals):
+        """Copia uma lista de indivíduos para a geração atual"""
+        current = self.current
+        for i, individual in enumerate(individuals):
+            current[i] = individual
+        return current
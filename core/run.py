@@ -0,0 +1,143 @@
+"""Execução headless do otimizador (sem pygame nem matplotlib).
+
+Uso:
+    python -m core.run --config config/config.json --seed 42 --out result.json
+"""
+import argparse
+import json
+import time
+
+from core.config import build_genetic, load_config
+from core.convergence import ConvergenceMonitor
+from core.instrumentation import Instrumentation
+from core.local_search import LocalSearch
+from core.utils import ensure_parent_dir
+
+
+def run_optimization(genetic, resume=False, time_budget=None):
+    """Roda o algoritmo genético na velocidade máxima até um critério de parada.
+
+    Com `time_budget` (segundos), a execução também para na primeira geração que terminar
+    depois do limite. Em caso de Ctrl-C, grava um checkpoint (se configurado) antes de
+    propagar a interrupção.
+    """
+    start = time.perf_counter()
+    if not resume:
+        genetic.last_improvement = 0
+    stop_reason = None
+    try:
+        while stop_reason is None:
+            stop_reason = genetic.next_generation()
+            if stop_reason is None and time_budget is not None and time.perf_counter() - start >= time_budget:
+                stop_reason = f"Tempo limite de {time_budget}s"
+    except KeyboardInterrupt:
+        if genetic.checkpoint_path:
+            genetic.save_checkpoint()
+        raise
+
+    return {
+        'selection_method': genetic.selection_method,
+        'generations': genetic.generation,
+        'stop_reason': stop_reason,
+        'best_fitness': genetic.best_fitness,
+        'best_layout': genetic.best_individual,
+        'fitness_history': genetic.fitness_history,
+        'history_offset': genetic.history_offset,
+        'elapsed_seconds': time.perf_counter() - start
+    }
+
+
+def save_result(result, out_file):
+    """Grava o resultado em JSON, criando o diretório se necessário"""
+    ensure_parent_dir(out_file)
+    with open(out_file, 'w') as f:
+        json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Otimização de layout de escritório sem interface gráfica")
+    parser.add_argument('--config', default='config/config.json', help="Arquivo JSON da planta")
+    parser.add_argument('--seed', type=int, default=None, help="Semente do gerador aleatório")
+    parser.add_argument('--out', default='result.json', help="Arquivo JSON de saída")
+    parser.add_argument('--time-budget', type=float, help="Tempo máximo de execução, em segundos")
+    parser.add_argument('--selection-method', choices=['roulette', 'tournament', 'rank'])
+    parser.add_argument('--crossover-method', choices=['one_point', 'two_point', 'uniform', 'geometric'])
+    parser.add_argument('--distance-neighbors', type=int,
+                        help="Plantas grandes: considera só as N mesas vizinhas nas colisões e distâncias")
+    parser.add_argument('--population-size', type=int)
+    parser.add_argument('--mutation-rate', type=float)
+    parser.add_argument('--max-generations', type=int)
+    parser.add_argument('--target-fitness', type=float)
+    parser.add_argument('--stagnation-limit', type=int)
+    parser.add_argument('--initializer', choices=['random', 'bottom_left'], help="Como criar a população inicial")
+    parser.add_argument('--elitism', type=int, help="Quantidade de melhores indivíduos mantidos a cada geração")
+    parser.add_argument('--backend', dest='evaluation_backend', choices=['serial', 'thread', 'process'])
+    parser.add_argument('--workers', type=int)
+    parser.add_argument('--convergence-window', type=int,
+                        help="Ativa a parada adaptativa: janela de gerações para medir a melhoria")
+    parser.add_argument('--min-improvement', type=float, default=1e-3,
+                        help="Melhoria relativa mínima do melhor fitness dentro da janela")
+    parser.add_argument('--local-search', choices=['hill_climb', 'annealing'],
+                        help="Ativa a busca local (memética) nos melhores indivíduos")
+    parser.add_argument('--local-search-every', type=int, default=10, help="Gerações entre as etapas de busca local")
+    parser.add_argument('--local-search-top-k', type=int, default=2, help="Quantos dos melhores indivíduos refinar")
+    parser.add_argument('--local-search-steps', type=int, default=200, help="Movimentos testados por indivíduo")
+    parser.add_argument('--local-search-budget', type=float, help="Tempo máximo de cada etapa de busca local, em segundos")
+    parser.add_argument('--metrics', help="Exporta métricas por geração (.json ou .csv)")
+    parser.add_argument('--telemetry', help="Grava um registro por geração, durante a execução (.jsonl ou .csv)")
+    parser.add_argument('--history-limit', type=int,
+                        help="Gerações do fitness_history mantidas em memória (o arquivo de telemetria guarda todas)")
+    parser.add_argument('--checkpoint', dest='checkpoint_path', help="Arquivo .npz de checkpoint")
+    parser.add_argument('--checkpoint-every', type=int, help="Gerações entre checkpoints")
+    parser.add_argument('--resume', action='store_true', help="Retoma a partir do arquivo de --checkpoint")
+    parser.add_argument('--warm-start', nargs='+', help="Resultados anteriores (arquivos ou diretórios) usados como ponto de partida")
+    parser.add_argument('--warm-start-fraction', type=float, help="Fração da população inicial semeada com layouts anteriores")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    overrides = vars(args)
+    config_file = overrides.pop('config')
+    out_file = overrides.pop('out')
+    metrics_file = overrides.pop('metrics')
+    resume = overrides.pop('resume')
+    time_budget = overrides.pop('time_budget')
+    window = overrides.pop('convergence_window')
+    min_improvement = overrides.pop('min_improvement')
+    local_search = {
+        'every': overrides.pop('local_search_every'),
+        'top_k': overrides.pop('local_search_top_k'),
+        'steps': overrides.pop('local_search_steps'),
+        'time_budget': overrides.pop('local_search_budget')
+    }
+    if overrides['local_search']:
+        overrides['local_search'] = LocalSearch(method=overrides['local_search'], **local_search)
+    if window:
+        overrides['convergence'] = ConvergenceMonitor(window=window, min_relative_improvement=min_improvement)
+    if metrics_file:
+        overrides['instrumentation'] = Instrumentation()
+
+    genetic = build_genetic(load_config(config_file), **overrides)
+    if resume:
+        genetic.load_checkpoint()
+    try:
+        result = run_optimization(genetic, resume=resume, time_budget=time_budget)
+    finally:
+        genetic.close()
+    result['seed'] = args.seed
+    result['config'] = config_file
+
+    save_result(result, out_file)
+    if metrics_file:
+        if metrics_file.endswith('.csv'):
+            genetic.metrics.to_csv(metrics_file)
+        else:
+            genetic.metrics.to_json(metrics_file)
+    print(f"{result['stop_reason']} | melhor fitness {result['best_fitness']:.2f} "
+          f"em {result['generations']} gerações ({result['elapsed_seconds']:.2f}s) -> {out_file}")
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
-import pygame
+from core.utils import RENDER_FPS
+from core.worker import OptimizerThread
 
 class Simulator:
     def __init__(self, visualizer, genetic):
@@ -7,12 +8,20 @@ class Simulator:
         self.running = True
         self.paused = False
         self.show_info = True
+        self.optimizer = None
 
     def run(self):
-        """Loop principal com tratamento de erros robusto"""
+        """Loop principal: o algoritmo genético roda em segundo plano e a tela mostra o snapshot mais recente"""
+        # Importado só aqui para que o pacote core não carregue o pygame fora da interface
+        import pygame
+
+        self.genetic.last_improvement = 0
+        self.optimizer = OptimizerThread(self.genetic)
         try:
+            # O otimizador já começa enquanto o pygame abre a janela e carrega as fontes
+            self.optimizer.start()
+            self.visualizer.open_window()
             clock = pygame.time.Clock()
-            self.genetic.last_improvement = 0
 
             while self.running:
                 # 1. Processa eventos
@@ -21,39 +30,53 @@ class Simulator:
                         self.running = False
                     elif event.type == pygame.KEYDOWN:
                         self._handle_key_event(event)
+                    elif event.type == pygame.VIDEOEXPOSE:
+                        self.visualizer.invalidate()
 
-                # 2. Atualização da simulação
-                if not self.paused:
-                    stop_reason = self.genetic.next_generation()
-
-                    # Sincroniza o estado com o visualizador
-                    self.visualizer.best_individual = self.genetic.best_individual
-                    self.visualizer.best_fitness = self.genetic.best_fitness
-                    self.visualizer.generation = self.genetic.generation
+                # 2. Sincroniza o snapshot mais recente do otimizador com o visualizador
+                snapshot = self.optimizer.latest()
+                self.visualizer.best_individual = snapshot.best_individual
+                self.visualizer.best_fitness = snapshot.best_fitness
+                self.visualizer.generation = snapshot.generation
 
-                    if stop_reason:
-                        print(f"PARANDO: {stop_reason}")
-                        self._handle_stop_condition(stop_reason)
-                        self.genetic.save_fitness_plot()
-                        break
+                if snapshot.stop_reason:
+                    print(f"PARANDO: {snapshot.stop_reason}")
+                    self._stop_optimizer()
+                    self._handle_stop_condition(snapshot.stop_reason)
+                    self.genetic.save_fitness_plot()
+                    break
 
-
-                # 3. Renderização
+                # 3. Renderização, na taxa de quadros da interface (draw atualiza só as regiões sujas)
                 self.visualizer.draw()
-                pygame.display.flip()
-                clock.tick(10)
+                clock.tick(RENDER_FPS)
 
+        except KeyboardInterrupt:
+            self._stop_optimizer()
+            if self.genetic.checkpoint_path:
+                self.genetic.save_checkpoint()
+                print(f"Checkpoint salvo em {self.genetic.checkpoint_path}")
         except Exception as e:
             print(f"ERRO: {str(e)}")
         finally:
+            self._stop_optimizer()
+            self.genetic.close()
             pygame.quit()
 
+    def _stop_optimizer(self):
+        """Pede para a thread do otimizador parar e espera a geração em andamento terminar"""
+        if self.optimizer is not None and self.optimizer.is_alive():
+            self.optimizer.stop()
+            self.optimizer.join()
+
     def _handle_key_event(self, event):
         """Gerencia eventos de teclado"""
+        import pygame
+
         if event.key == pygame.K_ESCAPE:
             self.running = False
         elif event.key == pygame.K_SPACE:
             self.paused = not self.paused
+            self.optimizer.toggle_pause()
         elif event.key == pygame.K_r:
             self._reset_simulation()
         elif event.key == pygame.K_i:
@@ -62,23 +85,22 @@ class Simulator:
 
     def _handle_stop_condition(self, stop_reason):
         """Mostra mensagem final e prepara para encerrar"""
+        import pygame
+
         self.visualizer.draw()
         self.draw_final_message(stop_reason)
         pygame.display.flip()
+        self.visualizer.invalidate()
         pygame.time.wait(3000)
 
     def _reset_simulation(self):
-        """Reinicia completamente a simulação"""
-        self.genetic.population = [
-            self.genetic.create_individual() for _ in range(self.genetic.population_size)
-        ]
-        self.genetic.generation = 0
-        self.genetic.best_fitness = -float('inf')
-        self.genetic.best_individual = None
-        self.genetic.last_improvement = 0
+        """Reinicia completamente a simulação (aplicado pela thread do otimizador entre gerações)"""
+        self.optimizer.reset()
 
     def draw_final_message(self, message):
         """Mostra mensagem quando o algoritmo termina"""
+        import pygame
+
         overlay = pygame.Surface((self.visualizer.width, self.visualizer.height), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 180))
 
@@ -0,0 +1,151 @@
+"""Varredura de hiperparâmetros em paralelo, sem interface gráfica.
+
+Uso:
+    python -m core.sweep --selection-method roulette tournament rank --population-size 20 40 \
+        --mutation-rate 0.05 0.1 --seeds 0 1 2 3 4 --out sweep.csv --summary summary.csv
+"""
+import argparse
+import csv
+import itertools
+import statistics
+
+from core.config import DEFAULT_PARAMS, build_genetic, load_config
+from core.run import run_optimization
+from core.utils import ensure_parent_dir
+
+# Parâmetros que formam a grade da varredura (a semente é tratada à parte, como repetição)
+GRID_PARAMS = ('selection_method', 'crossover_method', 'local_search', 'population_size', 'mutation_rate', 'spacing')
+
+# Configuração da planta de cada processo worker, recebida uma vez na inicialização do pool
+_worker_config = None
+
+
+def _init_worker(config):
+    global _worker_config
+    _worker_config = config
+
+
+def run_job(job, config=None):
+    """Executa uma combinação de parâmetros e retorna uma linha de resultado"""
+    genetic = build_genetic(config or _worker_config, **job)
+    try:
+        result = run_optimization(genetic)
+    finally:
+        genetic.close()
+
+    target = genetic.target_fitness
+    generations_to_target = next(
+        (g + 1 for g, fitness in enumerate(result['fitness_history'], start=result['history_offset'])
+         if fitness >= target), None
+    )
+    return {
+        **job,
+        'best_fitness': result['best_fitness'],
+        'generations': result['generations'],
+        'generations_to_target': generations_to_target,
+        'wall_time_s': result['elapsed_seconds'],
+        'stop_reason': result['stop_reason']
+    }
+
+
+def build_jobs(grid, seeds):
+    """Produto cartesiano da grade de parâmetros com as sementes"""
+    keys = [key for key in GRID_PARAMS if key in grid]
+    return [
+        {**dict(zip(keys, values)), 'seed': seed}
+        for values in itertools.product(*(grid[key] for key in keys))
+        for seed in seeds
+    ]
+
+
+def run_sweep(config, grid, seeds, workers=None):
+    """Roda todas as combinações em um pool de processos; a ordem das linhas segue a ordem dos jobs"""
+    jobs = build_jobs(grid, seeds)
+    if workers == 1:
+        return [run_job(job, config) for job in jobs]
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(config,)) as pool:
+        return list(pool.map(run_job, jobs))
+
+
+def summarize(rows, keys=GRID_PARAMS):
+    """Agrega as repetições (sementes) de cada combinação de parâmetros"""
+    groups = {}
+    for row in rows:
+        groups.setdefault(tuple(row.get(key) for key in keys), []).append(row)
+
+    summary = []
+    for values, group in groups.items():
+        fitness = [row['best_fitness'] for row in group]
+        reached = [row['generations_to_target'] for row in group if row['generations_to_target'] is not None]
+        summary.append({
+            **{key: value for key, value in zip(keys, values) if value is not None},
+            'runs': len(group),
+            'best_fitness_mean': statistics.fmean(fitness),
+            'best_fitness_std': statistics.pstdev(fitness),
+            'best_fitness_min': min(fitness),
+            'best_fitness_max': max(fitness),
+            'target_rate': len(reached) / len(group),
+            'generations_to_target_mean': statistics.fmean(reached) if reached else None,
+            'wall_time_mean_s': statistics.fmean(row['wall_time_s'] for row in group)
+        })
+    summary.sort(key=lambda row: row['best_fitness_mean'], reverse=True)
+    return summary
+
+
+def write_table(rows, path):
+    """Grava as linhas em CSV, ou em Parquet (requer pandas + pyarrow) se a extensão for .parquet"""
+    ensure_parent_dir(path)
+    if path.endswith('.parquet'):
+        import pandas as pd
+
+        pd.DataFrame(rows).to_parquet(path, index=False)
+        return
+    fields = []
+    for row in rows:
+        fields.extend(key for key in row if key not in fields)
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Varredura paralela de métodos de seleção e hiperparâmetros")
+    parser.add_argument('--config', default='config/config.json', help="Arquivo JSON da planta")
+    parser.add_argument('--selection-method', nargs='+', choices=['roulette', 'tournament', 'rank'],
+                        default=['roulette', 'tournament', 'rank'])
+    parser.add_argument('--crossover-method', nargs='+', choices=['one_point', 'two_point', 'uniform', 'geometric'],
+                        default=['one_point'])
+    parser.add_argument('--local-search', nargs='+', choices=['none', 'hill_climb', 'annealing'], default=['none'],
+                        help="Busca local nos melhores indivíduos (none = desligada)")
+    parser.add_argument('--population-size', nargs='+', type=int, default=[DEFAULT_PARAMS['population_size']])
+    parser.add_argument('--mutation-rate', nargs='+', type=float, default=[DEFAULT_PARAMS['mutation_rate']])
+    parser.add_argument('--spacing', nargs='+', type=float, default=[DEFAULT_PARAMS['spacing']])
+    parser.add_argument('--seeds', nargs='+', type=int, default=[0, 1, 2])
+    parser.add_argument('--workers', type=int, default=None, help="Processos em paralelo (padrão: todos os núcleos)")
+    parser.add_argument('--out', default='sweep.csv', help="Tabela com uma linha por execução (.csv ou .parquet)")
+    parser.add_argument('--summary', help="Tabela com a estatística de cada combinação (.csv ou .parquet)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    grid = {key: getattr(args, key) for key in GRID_PARAMS}
+    grid['local_search'] = [None if method == 'none' else method for method in grid['local_search']]
+    rows = run_sweep(load_config(args.config), grid, args.seeds, workers=args.workers)
+    write_table(rows, args.out)
+
+    summary = summarize(rows)
+    if args.summary:
+        write_table(summary, args.summary)
+    for row in summary:
+        params = ", ".join(f"{key}={row[key]}" for key in GRID_PARAMS if key in row)
+        print(f"{params}: fitness {row['best_fitness_mean']:.2f} ± {row['best_fitness_std']:.2f} "
+              f"(alvo em {row['target_rate']:.0%}) {row['wall_time_mean_s']:.2f}s")
+    return summary
+
+
+if __name__ == "__main__":
+    main()
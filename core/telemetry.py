@@ -0,0 +1,91 @@
+import csv
+import json
+import os
+
+from core.utils import ensure_parent_dir
+
+# Formatos de arquivo suportados, escolhidos pela extensão
+TELEMETRY_FORMATS = ('.jsonl', '.csv')
+
+# Colunas do CSV (o JSONL grava todas as chaves de cada registro)
+TELEMETRY_FIELDS = (
+    'generation', 'best_fitness', 'mean_fitness', 'worst_fitness', 'best_so_far',
+    'diversity', 'mutation_rate', 'time_generation'
+)
+
+
+class TelemetrySink:
+    """Grava um registro por geração em um arquivo só de acréscimo (JSONL ou CSV).
+
+    Os registros ficam em um buffer e vão para o disco a cada `flush_every` gerações,
+    então a memória usada é constante e o arquivo pode ser acompanhado durante a
+    execução. Ao retomar de um checkpoint, o arquivo existente continua sendo
+    estendido; `read_telemetry` mantém o último registro de cada geração.
+    """
+
+    def __init__(self, path, flush_every=10):
+        ext = os.path.splitext(path)[1]
+        if ext not in TELEMETRY_FORMATS:
+            raise ValueError(f"Formato de telemetria desconhecido: {path} (use .jsonl ou .csv)")
+        self.path = path
+        self.csv = ext == '.csv'
+        self.flush_every = max(1, flush_every)
+        self.pending = []
+
+        ensure_parent_dir(path)
+
+    def write(self, record):
+        """Acrescenta o registro de uma geração ao buffer, gravando o lote quando ele enche"""
+        self.pending.append(record)
+        if len(self.pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Grava no arquivo os registros pendentes"""
+        if not self.pending:
+            return
+        if self.csv:
+            new_file = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+            with open(self.path, 'a', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=TELEMETRY_FIELDS, extrasaction='ignore')
+                if new_file:
+                    writer.writeheader()
+                writer.writerows(self.pending)
+        else:
+            with open(self.path, 'a') as f:
+                f.writelines(json.dumps(record, ensure_ascii=False) + '\n' for record in self.pending)
+        self.pending = []
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _parse_csv_value(value):
+    if value == '':
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def read_telemetry(path):
+    """Lê os registros gravados por TelemetrySink, ordenados por geração.
+
+    Gerações repetidas (execução retomada de um checkpoint anterior) ficam com o último registro.
+    """
+    records = {}
+    with open(path, newline='') as f:
+        if path.endswith('.csv'):
+            rows = ({key: _parse_csv_value(value) for key, value in row.items()} for row in csv.DictReader(f))
+        else:
+            rows = (json.loads(line) for line in f if line.strip())
+        for row in rows:
+            records[row['generation']] = row
+    return [records[generation] for generation in sorted(records)]
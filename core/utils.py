@@ -1,5 +1,8 @@
-# Espaçamento padrão necessário entre mesas e cadeiras
-CHAIR_SPACE = 1.5
+import glob
+import os
+
+# Espaçamento necessário para as cadeiras, definido junto com o modelo de cadeiras
+from core.chairs import CHAIR_SPACE, chair_count
 
 # Paleta de cores usada na visualização
 COLORS = {
@@ -20,7 +23,27 @@ DEFAULT_SCALE = 15
 # Render config
 WINDOW_PADDING = 300
 
+# Quadros por segundo da interface (o algoritmo genético roda em uma thread separada)
+RENDER_FPS = 30
+
 # Cadeiras por tipo de mesa
 def get_chair_count_for_table(table_width: int) -> int:
-    """Retorna o número de cadeiras com base na largura da mesa"""
-    return 4 if table_width == 20 else 2
\ No newline at end of file
+    """Retorna o número de cadeiras com base na largura (base) da mesa"""
+    return chair_count({'w': table_width})
+
+def json_files(sources):
+    """Expande a lista de fontes: diretórios viram seus arquivos *.json (em ordem), arquivos ficam como estão"""
+    files = []
+    for source in sources:
+        if os.path.isdir(source):
+            files.extend(sorted(glob.glob(os.path.join(source, '*.json'))))
+        else:
+            files.append(source)
+    return files
+
+
+def ensure_parent_dir(path):
+    """Cria o diretório de um arquivo de saída, se necessário"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
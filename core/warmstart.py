@@ -0,0 +1,86 @@
+import json
+
+from core.genome import ROT, X, Y
+from core.utils import json_files
+
+
+def _tables_from(data):
+    """Extrai a lista de mesas posicionadas de um arquivo de resultado ou de configuração"""
+    if isinstance(data, list):
+        return data
+    if data.get('best_layout'):
+        return data['best_layout']
+    planta = data.get('planta', {})
+    return [elem for elem in planta.get('elementos', []) if elem['tipo'] == 'mesa' and 'x' in elem]
+
+
+def load_layouts(sources):
+    """Carrega layouts anteriores a partir de arquivos JSON ou diretórios com arquivos JSON.
+
+    Aceita os resultados de `core.run`/`core.islands` (chave best_layout), listas de mesas
+    e configurações cujas mesas já tenham x e y.
+    """
+    if isinstance(sources, str):
+        sources = [sources]
+    layouts = []
+    for path in json_files(sources):
+        with open(path) as f:
+            tables = _tables_from(json.load(f))
+        if tables:
+            layouts.append(tables)
+    return layouts
+
+
+def repair(genetic, genes):
+    """Mantém as mesas que continuam válidas na planta atual e reposiciona as demais.
+
+    Mesas em áreas restritas novas, fora dos limites ou em conflito com mesas já mantidas
+    recebem uma nova posição sorteada do mapa de viabilidade (mesmas 50 tentativas de
+    create_individual).
+    """
+    layout = genetic.layout
+    placed = layout.new_table_index()
+    invalid = []
+    for i in range(len(genes)):
+        w, h = genetic.genome.table_dims(i, genes[i, ROT])
+        x, y = int(genes[i, X]), int(genes[i, Y])
+        if layout.is_valid_rect(x, y, w, h, placed, rot=genes[i, ROT]):
+            placed.insert(i, x, y, w, h)
+        else:
+            invalid.append(i)
+
+    for i in invalid:
+        genes[i, ROT] = 0
+        w, h = genetic.genome.table_dims(i, 0)
+        placed_ok = False
+        for _ in range(50):
+            position = layout.random_position(genetic.rng, w, h)
+            if position is None:
+                break
+            x, y = position
+            if not placed.collides(x, y, w, h):
+                genes[i, X], genes[i, Y] = x, y
+                placed.insert(i, x, y, w, h)
+                placed_ok = True
+                break
+        if not placed_ok:
+            # Sem posição livre (ou mapa de viabilidade vazio): estaciona fora da planta
+            genes[i, X], genes[i, Y] = -10, -10
+    return genes
+
+
+def seed_population(genetic, layouts, fraction=0.5):
+    """Substitui parte da população inicial por layouts anteriores reparados.
+
+    Quando há menos layouts do que vagas, os layouts são repetidos com mutação para
+    manter a diversidade; o restante da população continua aleatório.
+    """
+    if not layouts:
+        return 0
+    count = min(len(genetic.population), max(1, int(len(genetic.population) * fraction)))
+    seeds = [repair(genetic, genetic.genome.encode(tables)) for tables in layouts]
+    for i in range(count):
+        genetic.population[i] = seeds[i % len(seeds)]
+        if i >= len(seeds):
+            genetic.mutate(genetic.population[i])
+    return count
@@ -0,0 +1,78 @@
+import queue
+import threading
+from collections import namedtuple
+
+# Estado publicado pelo otimizador para a interface
+Snapshot = namedtuple('Snapshot', ['generation', 'best_fitness', 'best_individual', 'stop_reason'])
+
+
+class OptimizerThread(threading.Thread):
+    """Executa o algoritmo genético em uma thread de fundo, sem depender da taxa de quadros.
+
+    Depois de cada geração, publica um Snapshot imutável em um único atributo; a
+    interface lê sempre o mais recente com `latest()`, sem locks. Pausar, reiniciar e
+    parar são comandos enfileirados, aplicados pela própria thread entre gerações.
+    """
+
+    def __init__(self, genetic):
+        super().__init__(name="optimizer", daemon=True)
+        self.genetic = genetic
+        self._commands = queue.SimpleQueue()
+        self._wake = threading.Event()
+        self._paused = False
+        self._stopped = False
+        self._snapshot = None
+        self._publish(None)
+
+    def _publish(self, stop_reason):
+        genetic = self.genetic
+        self._snapshot = Snapshot(genetic.generation, genetic.best_fitness, genetic.best_individual, stop_reason)
+
+    def latest(self):
+        """Snapshot mais recente publicado pelo otimizador"""
+        return self._snapshot
+
+    def _send(self, command):
+        self._commands.put(command)
+        self._wake.set()
+
+    def toggle_pause(self):
+        self._send("pause")
+
+    def reset(self):
+        self._send("reset")
+
+    def stop(self):
+        self._send("stop")
+
+    def _process_commands(self):
+        while True:
+            try:
+                command = self._commands.get_nowait()
+            except queue.Empty:
+                return
+            if command == "pause":
+                self._paused = not self._paused
+            elif command == "reset":
+                self.genetic.reset()
+                self._publish(None)
+            elif command == "stop":
+                self._stopped = True
+
+    def run(self):
+        try:
+            while True:
+                self._process_commands()
+                if self._stopped:
+                    return
+                if self._paused:
+                    self._wake.wait()
+                    self._wake.clear()
+                    continue
+
+                stop_reason = self.genetic.next_generation()
+                self._publish(stop_reason)
+                if stop_reason:
+                    return
+        except Exception as e:
+            self._publish(f"ERRO: {str(e)}")
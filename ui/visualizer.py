@@ -1,26 +1,21 @@
 import pygame
-import json
-from core.genetics import GeneticAlgorithm
-from core.layout import Layout
-from core.utils import CHAIR_SPACE, COLORS, DEFAULT_SCALE, WINDOW_PADDING, get_chair_count_for_table
+from core.config import build_genetic, get_params, load_config, split_elements
+from core.chairs import chair_clearance, chair_positions
+from core.utils import COLORS, DEFAULT_SCALE, WINDOW_PADDING
 
 class OfficeLayoutVisualizer:
     def __init__(self, config_file):
-        pygame.init()
-        pygame.font.init()
-
         # Carrega a configuração
-        with open(config_file) as f:
-            self.config = json.load(f)
+        self.config = load_config(config_file)
         
         self.planta = self.config['planta']
-        self.fixed_elements = [elem for elem in self.planta['elementos'] if elem.get('fixo', False)]
-        self.movable_tables = [elem for elem in self.planta['elementos'] if elem['tipo'] == 'mesa']
+        self.fixed_elements, self.movable_tables = split_elements(self.planta)
 
-        self.max_generations = 300  # Critério 1: Número máximo de gerações
-        self.target_fitness = 450    # Critério 2: Fitness desejado
-        self.stagnation_limit = 100  # Critério 3: Gerações
-        self.selection_method = "tournament"
+        params = get_params(self.config)
+        self.max_generations = params['max_generations']  # Critério 1: Número máximo de gerações
+        self.target_fitness = params['target_fitness']    # Critério 2: Fitness desejado
+        self.stagnation_limit = params['stagnation_limit']  # Critério 3: Gerações
+        self.selection_method = params['selection_method']
         
         # Parâmetros de visualização
         self.scale = DEFAULT_SCALE  # Escala para visualização (pixels por unidade)
@@ -31,44 +26,28 @@ class OfficeLayoutVisualizer:
         self.colors = COLORS
         
         # Parâmetros do algoritmo genético
-        self.population_size = 40
-        self.mutation_rate = 0.1
-        self.spacing = 2
+        self.population_size = params['population_size']
+        self.mutation_rate = params['mutation_rate']
+        self.spacing = params['spacing']
+
+        # Janela, fontes e superfície estática são criadas só em open_window
+        self.screen = None
+        self.font = None
+        self.big_font = None
+        self.background = None
 
-        # Configuração da janela
-        self.screen = pygame.display.set_mode((self.width + WINDOW_PADDING, self.height))
-        pygame.display.set_caption("Otimização de Layout com Algoritmo Genético")
-        self.font = pygame.font.SysFont('Arial', 14)
-        self.big_font = pygame.font.SysFont('Arial', 18, bold=True)
+        # Estado do último quadro desenhado
+        self._table_keys = []
+        self._table_rects = []
+        self._status = None
+        self._full_redraw = True
 
         # Inicialização do algoritmo genético e layout
-        
-        self.layout = Layout(
-            planta=self.planta,
-            fixed_elements=self.fixed_elements,
-            movable_tables=self.movable_tables,
-            spacing=self.spacing
-        )
-        
-        # Parâmetros do algoritmo genético
-        self.restricted_areas = self.layout.calculate_restricted_areas()
-
-        self.genetic = GeneticAlgorithm(
-            planta=self.planta,
-            movable_tables=self.movable_tables,
-            restricted_areas=self.restricted_areas,
-            spacing=self.spacing,
-            mutation_rate=self.mutation_rate,
-            layout=self.layout,
-            selection_method=self.selection_method,
-            population_size=self.population_size,
-            max_generations=self.max_generations,
-            target_fitness=self.target_fitness,
-            stagnation_limit=self.stagnation_limit
-        )
+        self.genetic = build_genetic(self.config)
+        self.layout = self.genetic.layout
+        self.restricted_areas = self.layout.restricted_areas
         
         # Estado da simulação
-        self.population = [self.genetic.create_individual() for _ in range(self.population_size)]
         self.generation = 0
         self.best_fitness = -float('inf')
         self.best_individual = None
@@ -76,9 +55,9 @@ class OfficeLayoutVisualizer:
         self.paused = False
         self.show_info = True
 
-        fitness_scores = [self.genetic.fitness(ind) for ind in self.genetic.population]
-        self.genetic.best_individual = self.genetic.population[fitness_scores.index(max(fitness_scores))]
-        self.genetic.best_fitness = max(fitness_scores)
+        fitness_scores = self.genetic.evaluate_population(self.genetic.population)
+        best_fitness = max(fitness_scores)
+        self.genetic.set_best(self.genetic.population[fitness_scores.index(best_fitness)], best_fitness)
 
         # Adicione estas linhas:
         self.best_individual = self.genetic.best_individual
@@ -86,71 +65,44 @@ class OfficeLayoutVisualizer:
 
 
 
-    def draw(self):
-            """Desenha a visualização"""
-            self.screen.fill(self.colors['background'])
-            
-            # Desenha elementos fixos
+    def open_window(self):
+            """Inicializa o pygame, abre a janela e pré-renderiza o fundo (só na primeira chamada)"""
+            if self.screen is not None:
+                return
+            pygame.init()
+            pygame.font.init()
+            self.screen = pygame.display.set_mode((self.width + WINDOW_PADDING, self.height))
+            pygame.display.set_caption("Otimização de Layout com Algoritmo Genético")
+            self.font = pygame.font.SysFont('Arial', 14)
+            self.big_font = pygame.font.SysFont('Arial', 18, bold=True)
+            self.background = self._build_background()
+            self._full_redraw = True
+
+    def invalidate(self):
+            """Força o redesenho completo no próximo quadro (ex.: depois de algo ser desenhado por cima)"""
+            self._full_redraw = True
+
+    def _build_background(self):
+            """Pré-renderiza a planta estática (paredes, banheiro, áreas restritas) e a legenda constante"""
+            background = pygame.Surface(self.screen.get_size()).convert()
+            background.fill(self.colors['background'])
+
+            # Elementos fixos
             for elem in self.fixed_elements:
                 color = self.colors['wall'] if elem['tipo'] == 'parede' else \
                         self.colors['bathroom'] if elem['tipo'] == 'banheiro' else \
                         self.colors['restriction']
                 
                 pygame.draw.rect(
-                    self.screen, color,
+                    background, color,
                     (elem['x'] * self.scale, elem['y'] * self.scale,
                     elem['w'] * self.scale, elem['h'] * self.scale)
                 )
-            
-            # Desenha as mesas da melhor solução atual
-            if self.best_individual:
-                for table in self.best_individual:
-                    chair_space = CHAIR_SPACE
-                    valid_position = (chair_space <= table['y'] and 
-                                    table['y'] + table['h'] <= self.planta['altura'] - chair_space and
-                                    0 <= table['x'] <= self.planta['largura'] - table['w'])
-                    
-                    color = self.colors['table_valid'] if valid_position else self.colors['table_invalid']
-
-                    pygame.draw.rect(
-                        self.screen, color,
-                        (table['x'] * self.scale, table['y'] * self.scale,
-                        table['w'] * self.scale, table['h'] * self.scale)
-                    )
-                    
-                    # Desenha cadeiras se posição for válida
-                    if valid_position:
-                        chairs = get_chair_count_for_table(table['w'])
-                        chair_radius = int(self.scale * 0.3)
-                        
-                        if chairs == 4:
-                            positions = [
-                                (table['x'] + table['w']/4, table['y'] - 0.5),
-                                (table['x'] + 3*table['w']/4, table['y'] - 0.5),
-                                (table['x'] + table['w']/4, table['y'] + table['h'] + 0.5),
-                                (table['x'] + 3*table['w']/4, table['y'] + table['h'] + 0.5)
-                            ]
-                        else:
-                            positions = [
-                                (table['x'] + table['w']/3, table['y'] - 0.5),
-                                (table['x'] + 2*table['w']/3, table['y'] + table['h'] + 0.5)
-                            ]
-                        
-                        for cx, cy in positions:
-                            pygame.draw.circle(
-                                self.screen, self.colors['chair'],
-                                (int((cx) * self.scale), int((cy) * self.scale)),
-                                chair_radius
-                            )
-            
-            # Painel de informações
-            pygame.draw.rect(self.screen, (220, 220, 220), (self.width, 0, 300, self.height))
-            
-            info_y = 20
+
+            # Painel de informações: só os textos que não mudam durante a execução
+            pygame.draw.rect(background, (220, 220, 220), (self.width, 0, WINDOW_PADDING, self.height))
+            info_y = 20 + 2 * 20 + 10
             texts = [
-                f"Geração: {self.generation}",
-                f"Melhor Fitness: {self.best_fitness:.2f}",
-                "",
                 "Controles:",
                 "Espaço: Pausar/Continuar",
                 "I: Mostrar/Ocultar Info",
@@ -163,14 +115,108 @@ class OfficeLayoutVisualizer:
                 "Azul: Banheiro",
                 "Cinza: Área restrita"
             ]
-            
             for text in texts:
-                if text.startswith("Geração") or text.startswith("Melhor"):
-                    rendered = self.big_font.render(text, True, self.colors['text'])
-                else:
-                    rendered = self.font.render(text, True, self.colors['text'])
-                self.screen.blit(rendered, (self.width + 10, info_y))
+                background.blit(self.font.render(text, True, self.colors['text']), (self.width + 10, info_y))
                 info_y += 20 if text else 10
+            return background
+
+    def _table_rect(self, table):
+            """Retângulo de tela ocupado pela mesa e suas cadeiras"""
+            return pygame.Rect((table['x'] - 1) * self.scale, (table['y'] - 1) * self.scale,
+                               (table['w'] + 2) * self.scale, (table['h'] + 2) * self.scale)
+
+    def _draw_table(self, table):
+            """Desenha uma mesa e, se a posição for válida, suas cadeiras"""
+            valid_position = (0 <= table['x'] <= self.planta['largura'] - table['w'] and
+                            0 <= table['y'] <= self.planta['altura'] - table['h'] and
+                            chair_clearance(table['x'], table['y'], table['w'], table['h'], table.get('rot', 0),
+                                            self.planta['largura'], self.planta['altura'],
+                                            areas=self.restricted_areas))
             
-            pygame.display.flip()
-    
\ No newline at end of file
+            color = self.colors['table_valid'] if valid_position else self.colors['table_invalid']
+
+            pygame.draw.rect(
+                self.screen, color,
+                (table['x'] * self.scale, table['y'] * self.scale,
+                table['w'] * self.scale, table['h'] * self.scale)
+            )
+            
+            # Desenha cadeiras se posição for válida (nos lados definidos pela orientação da mesa)
+            if valid_position:
+                chair_radius = int(self.scale * 0.3)
+                
+                for cx, cy in chair_positions(table):
+                    pygame.draw.circle(
+                        self.screen, self.colors['chair'],
+                        (int((cx) * self.scale), int((cy) * self.scale)),
+                        chair_radius
+                    )
+
+    def _draw_tables(self):
+            """Redesenha só as mesas que mudaram de posição; retorna os retângulos sujos"""
+            tables = self.best_individual or []
+            keys = [(t['x'], t['y'], t['w'], t['h']) for t in tables]
+            plant_rect = pygame.Rect(0, 0, self.width, self.height)
+
+            if self._full_redraw:
+                self._table_keys, self._table_rects = keys, [self._table_rect(t) for t in tables]
+                self.screen.set_clip(plant_rect)
+                for table in tables:
+                    self._draw_table(table)
+                self.screen.set_clip(None)
+                return [plant_rect]
+
+            old_keys, old_rects = self._table_keys, self._table_rects
+            rects = list(old_rects[:len(keys)]) + [None] * (len(keys) - len(old_rects))
+            dirty = list(old_rects[len(keys):])
+            for i, (key, table) in enumerate(zip(keys, tables)):
+                if i < len(old_keys) and old_keys[i] == key:
+                    continue
+                if rects[i] is not None:
+                    dirty.append(rects[i])
+                rects[i] = self._table_rect(table)
+                dirty.append(rects[i])
+            self._table_keys, self._table_rects = keys, rects
+            dirty = [rect.clip(plant_rect) for rect in dirty]
+            dirty = [rect for rect in dirty if rect.width and rect.height]
+            if not dirty:
+                return []
+
+            # Restaura o fundo nas regiões sujas e redesenha as mesas que as tocam
+            self.screen.set_clip(plant_rect)
+            for rect in dirty:
+                self.screen.blit(self.background, rect, rect)
+            for table, rect in zip(tables, rects):
+                if rect.collidelist(dirty) != -1:
+                    self._draw_table(table)
+            self.screen.set_clip(None)
+            return dirty
+
+    def _draw_status(self):
+            """Renderiza geração e melhor fitness apenas quando mudam"""
+            status = (self.generation, self.best_fitness)
+            if status == self._status and not self._full_redraw:
+                return []
+            self._status = status
+
+            rect = pygame.Rect(self.width, 0, WINDOW_PADDING, 20 + 2 * 20)
+            self.screen.blit(self.background, rect, rect)
+            info_y = 20
+            for text in (f"Geração: {self.generation}", f"Melhor Fitness: {self.best_fitness:.2f}"):
+                self.screen.blit(self.big_font.render(text, True, self.colors['text']), (self.width + 10, info_y))
+                info_y += 20
+            return [rect]
+
+    def draw(self):
+            """Desenha a visualização, atualizando na tela só as regiões que mudaram"""
+            self.open_window()
+            if self._full_redraw:
+                self.screen.blit(self.background, (0, 0))
+
+            dirty = self._draw_tables() + self._draw_status()
+
+            if self._full_redraw:
+                self._full_redraw = False
+                pygame.display.flip()
+            elif dirty:
+                pygame.display.update(dirty)